@@ -1,8 +1,15 @@
+import threading
+
 import duckdb
 
 from .config import DB_PATH
 
+# duckdb.connect races when several threads open the same file at once
+# ("Unique file handle conflict"); background jobs make that common.
+_CONNECT_LOCK = threading.Lock()
+
 
 def get_connection() -> duckdb.DuckDBPyConnection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    return duckdb.connect(DB_PATH)
+    with _CONNECT_LOCK:
+        return duckdb.connect(DB_PATH)
@@ -1,4 +1,9 @@
-from fastapi import FastAPI, HTTPException
+import threading
+import time
+from typing import Annotated
+
+from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi.middleware.gzip import GZipMiddleware
 
 from src.project_meta import get_app_meta
 
@@ -22,11 +27,14 @@ from .schemas.workflow import (
 from .routers import export as export_router
 from .routers import items as items_router
 from .routers import snapshots as snapshots_router
-from .services import catalog, migrations, movies, workflow
+from .services import catalog, jobs, migrations, movies, workflow
 
 APP_META = get_app_meta()
+MAX_BATCH_MOVIE_IDS = 100
+OLLAMA_LISTING_TTL_SECONDS = 30.0
 
 app = FastAPI(title=f"{APP_META.app_name} API", version=APP_META.version)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 migrations.migrate()
 movies.init_table()
@@ -62,6 +70,52 @@ def ollama_models():
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+_ollama_listing_lock = threading.Lock()
+_ollama_listing: tuple[float, list[str]] | None = None
+_ollama_listing_refreshing = False
+
+
+def _refresh_ollama_listing() -> None:
+    global _ollama_listing, _ollama_listing_refreshing
+    try:
+        models = list_ollama_models()
+    except ClientError:
+        models = []
+    with _ollama_listing_lock:
+        _ollama_listing = (time.monotonic(), models)
+        _ollama_listing_refreshing = False
+
+
+def _cached_ollama_models() -> list[str]:
+    # Listing Ollama can fall back to an `ollama list` subprocess that waits up
+    # to the request timeout. Stats reads must never wait on that, so a stale
+    # listing is refreshed in the background while the last known one (empty
+    # before the first refresh ends) is served.
+    global _ollama_listing_refreshing
+    with _ollama_listing_lock:
+        cached = _ollama_listing
+        stale = cached is None or (
+            time.monotonic() - cached[0] >= OLLAMA_LISTING_TTL_SECONDS
+        )
+        start_refresh = stale and not _ollama_listing_refreshing
+        if start_refresh:
+            _ollama_listing_refreshing = True
+    if start_refresh:
+        threading.Thread(
+            target=_refresh_ollama_listing, name="ollama-listing", daemon=True
+        ).start()
+    return cached[1] if cached else []
+
+
+@app.get("/frontend/bootstrap")
+def frontend_bootstrap():
+    # Everything a page render needs up front, in a single round trip.
+    return {
+        "stats": movies.get_stats(),
+        "ollama_models": _cached_ollama_models(),
+    }
+
+
 @app.post("/covers/read")
 @app.post("/covers/ingest")
 def ingest_covers(payload: IngestRequest):
@@ -84,22 +138,51 @@ def covers_name_audit():
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
+def _workflow_run_kwargs(payload: WorkflowRunRequest) -> dict:
+    return {
+        "movie_id": payload.movie_id,
+        "limit": payload.limit,
+        "start_stage": payload.start_stage,
+        "stop_after": payload.stop_after,
+        "action": payload.action,
+        "overwrite": payload.overwrite,
+        "title_model": payload.title_model or VISION_TITLE_MODEL,
+        "team_model": payload.team_model or VISION_TEAM_MODEL,
+        "translation_model": payload.translation_model or TRANSLATION_MODEL,
+        "max_results": payload.max_results,
+        "max_attempts": _resolve_max_attempts(payload.max_attempts),
+    }
+
+
+def _extraction_kwargs(payload: RunExtractRequest) -> dict:
+    return {
+        "movie_id": payload.movie_id,
+        "limit": payload.limit,
+        "start_stage": "extraction",
+        "stop_after": "extraction",
+        "overwrite": payload.overwrite,
+        "title_model": payload.title_model or VISION_TITLE_MODEL,
+        "team_model": payload.team_model or VISION_TEAM_MODEL,
+        "max_attempts": WORKFLOW_MAX_ATTEMPTS,
+    }
+
+
+def _imdb_search_kwargs(payload: RunImdbRequest) -> dict:
+    return {
+        "movie_id": payload.movie_id,
+        "limit": payload.limit,
+        "start_stage": "imdb",
+        "stop_after": "imdb",
+        "overwrite": payload.overwrite,
+        "max_results": payload.max_results,
+        "max_attempts": WORKFLOW_MAX_ATTEMPTS,
+    }
+
+
 @app.post("/workflow/run")
 def workflow_run(payload: WorkflowRunRequest):
     try:
-        return workflow.run_batch(
-            movie_id=payload.movie_id,
-            limit=payload.limit,
-            start_stage=payload.start_stage,
-            stop_after=payload.stop_after,
-            action=payload.action,
-            overwrite=payload.overwrite,
-            title_model=payload.title_model or VISION_TITLE_MODEL,
-            team_model=payload.team_model or VISION_TEAM_MODEL,
-            translation_model=payload.translation_model or TRANSLATION_MODEL,
-            max_results=payload.max_results,
-            max_attempts=_resolve_max_attempts(payload.max_attempts),
-        )
+        return workflow.run_batch(**_workflow_run_kwargs(payload))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:
@@ -160,22 +243,54 @@ def workflow_mark_review(movie_id: str, payload: WorkflowMarkReviewRequest):
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+# -------------------------
+# Background jobs
+# -------------------------
+def _submit_job(kind: str, idempotency_key: str | None, kwargs: dict):
+    try:
+        return jobs.submit(
+            kind, workflow.run_batch, idempotency_key=idempotency_key, **kwargs
+        )
+    except jobs.IdempotencyKeyReused as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+
+@app.post("/jobs/workflow/run")
+def submit_workflow_run_job(
+    payload: WorkflowRunRequest, idempotency_key: str | None = Header(default=None)
+):
+    return _submit_job("workflow_run", idempotency_key, _workflow_run_kwargs(payload))
+
+
+@app.post("/jobs/extract/run")
+def submit_extraction_job(
+    payload: RunExtractRequest, idempotency_key: str | None = Header(default=None)
+):
+    return _submit_job("extract_run", idempotency_key, _extraction_kwargs(payload))
+
+
+@app.post("/jobs/imdb/search")
+def submit_imdb_search_job(
+    payload: RunImdbRequest, idempotency_key: str | None = Header(default=None)
+):
+    return _submit_job("imdb_search", idempotency_key, _imdb_search_kwargs(payload))
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = jobs.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Trabajo no encontrado")
+    return job
+
+
 # -------------------------
 # Legacy-compatible endpoints
 # -------------------------
 @app.post("/extract/run")
 def run_extraction(payload: RunExtractRequest):
     try:
-        return workflow.run_batch(
-            movie_id=payload.movie_id,
-            limit=payload.limit,
-            start_stage="extraction",
-            stop_after="extraction",
-            overwrite=payload.overwrite,
-            title_model=payload.title_model or VISION_TITLE_MODEL,
-            team_model=payload.team_model or VISION_TEAM_MODEL,
-            max_attempts=WORKFLOW_MAX_ATTEMPTS,
-        )
+        return workflow.run_batch(**_extraction_kwargs(payload))
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -183,15 +298,7 @@ def run_extraction(payload: RunExtractRequest):
 @app.post("/imdb/search")
 def run_imdb_search(payload: RunImdbRequest):
     try:
-        return workflow.run_batch(
-            movie_id=payload.movie_id,
-            limit=payload.limit,
-            start_stage="imdb",
-            stop_after="imdb",
-            overwrite=payload.overwrite,
-            max_results=payload.max_results,
-            max_attempts=WORKFLOW_MAX_ATTEMPTS,
-        )
+        return workflow.run_batch(**_imdb_search_kwargs(payload))
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -228,8 +335,40 @@ def translate_plot(payload: RunTranslationRequest):
 
 
 @app.get("/movies")
-def list_movies(stage: str | None = None, limit: int = 500):
-    return movies.list_movies(stage=stage, limit=limit)
+def list_movies(
+    stage: str | None = None,
+    limit: int = 500,
+    offset: int = 0,
+    has_imdb_id: bool = False,
+    has_plot_en: bool = False,
+    needs_review: bool = False,
+    review_stage: str | None = None,
+):
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="offset no puede ser negativo")
+    if review_stage is not None and review_stage not in movies.WORKFLOW_STAGE_ORDER:
+        raise HTTPException(status_code=400, detail="review_stage no válido")
+    return movies.list_movies(
+        stage=stage,
+        limit=limit,
+        offset=offset,
+        has_imdb_id=has_imdb_id,
+        has_plot_en=has_plot_en,
+        needs_review=needs_review,
+        review_stage=review_stage,
+    )
+
+
+# Declared before /movies/{movie_id} so "batch" is not taken as an id.
+@app.get("/movies/batch")
+def get_movies_batch(ids: Annotated[list[str] | None, Query()] = None):
+    ids = ids or []
+    if len(ids) > MAX_BATCH_MOVIE_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Como máximo {MAX_BATCH_MOVIE_IDS} ids por petición",
+        )
+    return movies.get_movies(ids)
 
 
 @app.get("/movies/{movie_id}")
@@ -240,13 +379,18 @@ def get_movie(movie_id: str):
     return movie
 
 
+def _updated_movie_response(movie_id: str) -> dict:
+    # The fresh row lets the frontend refresh its copy without another GET.
+    return {"ok": True, "movie": movies.get_movie(movie_id)}
+
+
 @app.put("/movies/{movie_id}/title-team")
 def update_title_team(movie_id: str, payload: UpdateTitleTeamRequest):
     if movies.get_movie(movie_id) is None:
         raise HTTPException(status_code=404, detail="Película no encontrada")
 
     movies.update_title_team(movie_id, payload.title, payload.team)
-    return {"ok": True}
+    return _updated_movie_response(movie_id)
 
 
 @app.put("/movies/{movie_id}/imdb")
@@ -259,7 +403,7 @@ def set_manual_imdb(movie_id: str, payload: ManualImdbRequest):
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    return {"ok": True}
+    return _updated_movie_response(movie_id)
 
 
 @app.put("/movies/{movie_id}/imdb-title-es")
@@ -268,7 +412,7 @@ def set_manual_imdb_title_es(movie_id: str, payload: ManualImdbTitleEsRequest):
         raise HTTPException(status_code=404, detail="Película no encontrada")
 
     movies.set_manual_imdb_title_es(movie_id, payload.title_es)
-    return {"ok": True}
+    return _updated_movie_response(movie_id)
 
 
 @app.put("/movies/{movie_id}/omdb")
@@ -277,7 +421,7 @@ def update_omdb(movie_id: str, payload: UpdateOmdbRequest):
         raise HTTPException(status_code=404, detail="Película no encontrada")
 
     movies.update_omdb_fields(movie_id, payload.fields)
-    return {"ok": True}
+    return _updated_movie_response(movie_id)
 
 
 @app.put("/movies/{movie_id}/plot-es")
@@ -291,4 +435,4 @@ def update_plot_es(movie_id: str, payload: UpdatePlotTranslationRequest):
         status="manual",
         error=None,
     )
-    return {"ok": True}
+    return _updated_movie_response(movie_id)
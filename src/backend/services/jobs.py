@@ -0,0 +1,153 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_ERROR = "error"
+ACTIVE_JOB_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+MAX_TRACKED_JOBS = 200
+MAX_IDEMPOTENCY_KEYS = 256
+
+# A single worker keeps long batches serialized, as they were when each
+# request blocked until the batch finished.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job")
+_LOCK = threading.Lock()
+_JOBS: dict[str, dict[str, Any]] = {}
+_IDEMPOTENCY_KEYS: OrderedDict[str, str] = OrderedDict()
+
+
+class IdempotencyKeyReused(Exception):
+    pass
+
+
+def _now_iso() -> str:
+    return datetime.now().astimezone().isoformat(timespec="seconds")
+
+
+def _public_view(job: dict[str, Any]) -> dict[str, Any]:
+    started = job.get("_started_monotonic")
+    finished = job.get("_finished_monotonic")
+    elapsed = 0.0
+    if started is not None:
+        elapsed = (finished if finished is not None else time.monotonic()) - started
+    view = {key: value for key, value in job.items() if not key.startswith("_")}
+    view["elapsed_seconds"] = round(elapsed, 1)
+    return view
+
+
+def _prune_locked() -> None:
+    overflow = len(_JOBS) - MAX_TRACKED_JOBS
+    if overflow <= 0:
+        return
+    finished_ids = [
+        job_id
+        for job_id, job in _JOBS.items()
+        if job["status"] not in ACTIVE_JOB_STATUSES
+    ]
+    for job_id in finished_ids[:overflow]:
+        _JOBS.pop(job_id, None)
+
+
+def _update(job_id: str, **fields: Any) -> None:
+    with _LOCK:
+        job = _JOBS.get(job_id)
+        if job is not None:
+            job.update(fields)
+
+
+def _run(job_id: str, func: Callable[..., Any], kwargs: dict[str, Any]) -> None:
+    _update(
+        job_id,
+        status=JOB_RUNNING,
+        started_at=_now_iso(),
+        _started_monotonic=time.monotonic(),
+    )
+    try:
+        result = func(**kwargs)
+    except Exception as exc:
+        _update(
+            job_id,
+            status=JOB_ERROR,
+            error=str(exc),
+            finished_at=_now_iso(),
+            _finished_monotonic=time.monotonic(),
+        )
+        return
+    _update(
+        job_id,
+        status=JOB_DONE,
+        result=result,
+        finished_at=_now_iso(),
+        _finished_monotonic=time.monotonic(),
+    )
+
+
+def _job_for_key_locked(
+    idempotency_key: str | None, request: tuple[str, dict[str, Any]]
+) -> dict[str, Any] | None:
+    if not idempotency_key:
+        return None
+    job_id = _IDEMPOTENCY_KEYS.get(idempotency_key)
+    job = _JOBS.get(job_id) if job_id else None
+    if job is None:
+        _IDEMPOTENCY_KEYS.pop(idempotency_key, None)
+        return None
+    if job["_request"] != request:
+        # Handing back the earlier job would pass its result off as this one's.
+        raise IdempotencyKeyReused(
+            "Idempotency-Key already used for a different request"
+        )
+    _IDEMPOTENCY_KEYS.move_to_end(idempotency_key)
+    return job
+
+
+def _remember_key_locked(idempotency_key: str | None, job_id: str) -> None:
+    if not idempotency_key:
+        return
+    _IDEMPOTENCY_KEYS[idempotency_key] = job_id
+    while len(_IDEMPOTENCY_KEYS) > MAX_IDEMPOTENCY_KEYS:
+        _IDEMPOTENCY_KEYS.popitem(last=False)
+
+
+def submit(
+    kind: str,
+    func: Callable[..., Any],
+    *,
+    idempotency_key: str | None = None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    job_id = uuid.uuid4().hex
+    job: dict[str, Any] = {
+        "job_id": job_id,
+        "kind": kind,
+        "status": JOB_QUEUED,
+        "result": None,
+        "error": None,
+        "created_at": _now_iso(),
+        "started_at": None,
+        "finished_at": None,
+        "_request": (kind, kwargs),
+    }
+    with _LOCK:
+        existing = _job_for_key_locked(idempotency_key, job["_request"])
+        if existing is not None:
+            return _public_view(existing)
+        _JOBS[job_id] = job
+        _remember_key_locked(idempotency_key, job_id)
+        _prune_locked()
+        view = _public_view(job)
+    _EXECUTOR.submit(_run, job_id, func, kwargs)
+    return view
+
+
+def get_job(job_id: str) -> dict[str, Any] | None:
+    with _LOCK:
+        job = _JOBS.get(job_id)
+        return _public_view(job) if job is not None else None
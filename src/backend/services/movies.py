@@ -5,6 +5,8 @@ from datetime import datetime
 from pathlib import Path, PureWindowsPath
 from typing import Any
 
+from src.workflow_stages import infer_review_stage
+
 from ..config import DEFAULT_COVERS_DIR, PROJECT_ROOT
 from ..multi_value import join_values, split_values
 from ..database import get_connection
@@ -1831,18 +1833,28 @@ def _row_to_dict(columns: list[str], row: tuple[Any, ...]) -> dict[str, Any]:
 
 
 
-def list_movies(stage: str | None = None, limit: int = 500) -> list[dict[str, Any]]:
+def list_movies(
+    stage: str | None = None,
+    limit: int = 500,
+    offset: int = 0,
+    *,
+    has_imdb_id: bool = False,
+    has_plot_en: bool = False,
+    needs_review: bool = False,
+    review_stage: str | None = None,
+) -> list[dict[str, Any]]:
     con = get_connection()
 
-    where = ""
+    conditions: list[str] = []
     pipeline_filter: str | None = None
     if stage == "needs_extraction":
-        where = f"WHERE {_MISSING_EXTRACTION_SQL}"
+        conditions.append(_MISSING_EXTRACTION_SQL)
     elif stage == "needs_manual_review":
-        where = "WHERE manual_title IS NULL OR manual_team_json IS NULL"
+        conditions.append("manual_title IS NULL OR manual_team_json IS NULL")
     elif stage == "needs_imdb":
-        where = f"""
-        WHERE imdb_url IS NULL
+        conditions.append(
+            f"""
+        imdb_url IS NULL
           OR imdb_url = ''
           OR (
                 {_EFFECTIVE_TITLE_SQL} IS NOT NULL
@@ -1851,15 +1863,19 @@ def list_movies(stage: str | None = None, limit: int = 500) -> list[dict[str, An
             AND {_IMDB_URL_PARTS_SQL} <> {_TITLE_PARTS_SQL}
           )
         """
+        )
     elif stage == "needs_title_es":
-        where = f"""
-        WHERE imdb_url IS NOT NULL
+        conditions.append(
+            f"""
+        imdb_url IS NOT NULL
           AND imdb_url <> ''
           AND {_TITLE_ES_PENDING_SQL}
         """
+        )
     elif stage == "needs_omdb":
-        where = f"""
-        WHERE imdb_id IS NOT NULL
+        conditions.append(
+            f"""
+        imdb_id IS NOT NULL
           AND imdb_id <> ''
           AND (
                 omdb_status IS NULL
@@ -1874,9 +1890,11 @@ def list_movies(stage: str | None = None, limit: int = 500) -> list[dict[str, An
              )
           )
         """
+        )
     elif stage == "needs_translation":
-        where = f"""
-        WHERE omdb_plot_en IS NOT NULL
+        conditions.append(
+            f"""
+        omdb_plot_en IS NOT NULL
           AND omdb_plot_en <> ''
           AND (
                 omdb_plot_es IS NULL
@@ -1887,8 +1905,9 @@ def list_movies(stage: str | None = None, limit: int = 500) -> list[dict[str, An
              )
           )
         """
+        )
     elif stage == "needs_workflow_review":
-        where = "WHERE workflow_needs_review = TRUE"
+        conditions.append("workflow_needs_review = TRUE")
     elif stage == "pipeline_extraction":
         pipeline_filter = "extraction"
     elif stage == "pipeline_imdb":
@@ -1904,8 +1923,21 @@ def list_movies(stage: str | None = None, limit: int = 500) -> list[dict[str, An
     elif stage == "pipeline_done":
         pipeline_filter = "done"
 
-    limit_clause = "" if pipeline_filter is not None else "LIMIT ?"
-    params = () if pipeline_filter is not None else (limit,)
+    if has_imdb_id:
+        conditions.append("imdb_id IS NOT NULL AND imdb_id <> ''")
+    if has_plot_en:
+        conditions.append("omdb_plot_en IS NOT NULL AND omdb_plot_en <> ''")
+    if needs_review or review_stage:
+        conditions.append("workflow_needs_review = TRUE")
+    where = ""
+    if conditions:
+        where = "WHERE " + " AND ".join(f"({condition})" for condition in conditions)
+
+    # Pipeline stage and review stage are derived in Python, so those
+    # filters page the rows after deriving them.
+    post_filter = pipeline_filter is not None or review_stage is not None
+    limit_clause = "" if post_filter else "LIMIT ? OFFSET ?"
+    params = () if post_filter else (limit, offset)
     rows = con.execute(
         f"""
         SELECT
@@ -2002,7 +2034,10 @@ def list_movies(stage: str | None = None, limit: int = 500) -> list[dict[str, An
 
     if pipeline_filter is not None:
         out = [row for row in out if str(row.get("pipeline_stage", "")).startswith(pipeline_filter)]
-        out = out[:limit]
+    if review_stage is not None:
+        out = [row for row in out if infer_review_stage(row) == review_stage]
+    if post_filter:
+        out = out[offset : offset + limit]
 
     return out
 
@@ -2022,6 +2057,23 @@ def get_movie(movie_id: str) -> dict[str, Any] | None:
     return _row_to_dict(columns, row)
 
 
+def get_movies(movie_ids: list[str]) -> list[dict[str, Any]]:
+    unique_ids = list(dict.fromkeys(movie_ids))
+    if not unique_ids:
+        return []
+
+    con = get_connection()
+    placeholders = ", ".join("?" for _ in unique_ids)
+    rows = con.execute(
+        f"SELECT * FROM movies WHERE id IN ({placeholders})", unique_ids
+    ).fetchall()
+    columns = [d[1] for d in con.execute("PRAGMA table_info(movies)").fetchall()]
+    con.close()
+
+    by_id = {movie["id"]: movie for movie in (_row_to_dict(columns, row) for row in rows)}
+    return [by_id[movie_id] for movie_id in unique_ids if movie_id in by_id]
+
+
 
 def get_stats() -> dict[str, int]:
     con = get_connection()
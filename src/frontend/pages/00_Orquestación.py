@@ -1,38 +1,51 @@
 import os
 
 import pandas as pd
-import requests
 import streamlit as st
 
 try:
     from src.frontend.utils import (
+        ApiTimeout,
         LONG_TIMEOUT_SECONDS,
         api_get,
         api_post,
+        gather,
         infer_review_stage,
+        job_in_progress,
+        invalidate_caches,
         node_ui_label,
         configure_page,
         render_icon_heading,
+        render_job_status,
         render_timeout_controls,
         select_movie_id,
         select_ollama_model,
         stage_ui_label,
         set_selected_movie_id,
+        start_job,
+        switch_page,
     )
 except ModuleNotFoundError:  # pragma: no cover
     from frontend.utils import (
+        ApiTimeout,
         LONG_TIMEOUT_SECONDS,
         api_get,
         api_post,
+        gather,
         infer_review_stage,
+        job_in_progress,
+        invalidate_caches,
         node_ui_label,
         configure_page,
         render_icon_heading,
+        render_job_status,
         render_timeout_controls,
         select_movie_id,
         select_ollama_model,
         stage_ui_label,
         set_selected_movie_id,
+        start_job,
+        switch_page,
     )
 
 configure_page()
@@ -106,14 +119,6 @@ def _build_workflow_dot(definition: dict) -> str:
     return "\n".join(lines)
 
 
-def _switch_page(target: str) -> None:
-    switch_fn = getattr(st, "switch_page", None)
-    if callable(switch_fn):
-        switch_fn(target)
-    else:
-        st.info("Tu versión de Streamlit no soporta `switch_page`.")
-
-
 render_icon_heading("Grafo", icon="sitemap", level=2)
 graph_def: dict = {}
 try:
@@ -161,14 +166,22 @@ snapshot = {
     "review_queue": [],
     "review_queue_size": 0,
 }
-try:
-    snapshot = api_get(
+snapshot_result, review_rows_result = gather(
+    lambda: api_get(
         "/workflow/snapshot",
         params={"limit": int(snapshot_limit), "review_limit": int(review_limit)},
-    )
-except Exception as exc:
-    st.error(str(exc))
+    ),
+    lambda: api_get(
+        "/movies",
+        params={"stage": "needs_workflow_review", "limit": int(review_limit)},
+    ),
+    return_exceptions=True,
+)
+if isinstance(snapshot_result, Exception):
+    st.error(str(snapshot_result))
     st.info("No se pudo cargar el snapshot de workflow.")
+else:
+    snapshot = snapshot_result
 
 stage_counts = snapshot.get("stage_counts", {})
 c1, c2, c3, c4, c5, c6, c7, c8 = st.columns(8)
@@ -272,7 +285,7 @@ with model_c3:
         key="orq_translation_model",
     )
 
-if st.button("Ejecutar workflow batch"):
+if st.button("Ejecutar workflow batch", disabled=job_in_progress("orq_workflow_job")):
     payload = {
         "movie_id": run_movie_id or None,
         "limit": int(run_limit),
@@ -286,28 +299,26 @@ if st.button("Ejecutar workflow batch"):
         "max_attempts": int(max_attempts),
     }
     try:
-        result = api_post("/workflow/run", json=payload, timeout=LONG_TIMEOUT_SECONDS)
-        st.success("Workflow completado")
-        st.json(result)
-    except requests.exceptions.ReadTimeout:
-        st.error("Timeout esperando al backend. Reduce límite o cambia el modo en Sidebar > HTTP timeout.")
+        start_job(
+            "/jobs/workflow/run",
+            payload,
+            state_key="orq_workflow_job",
+            done_message="Workflow completado",
+        )
     except Exception as exc:
         st.error(str(exc))
 
+render_job_status("orq_workflow_job")
+
 st.divider()
 
 render_icon_heading("Cola de revisión", icon="clipboard-check", level=2)
 review_queue = snapshot.get("review_queue", [])
 st.caption(f"Películas en cola de revisión: {snapshot.get('review_queue_size', 0)}")
 
-review_rows_detailed: list[dict] = []
-try:
-    review_rows_detailed = api_get(
-        "/movies",
-        params={"stage": "needs_workflow_review", "limit": int(review_limit)},
-    )
-except Exception:
-    review_rows_detailed = []
+review_rows_detailed: list[dict] = (
+    [] if isinstance(review_rows_result, Exception) else review_rows_result
+)
 
 if review_queue:
     df_review = pd.DataFrame(review_queue)
@@ -355,7 +366,7 @@ if review_rows_detailed:
         nav_f2, nav_fail, nav_all = st.columns(3)
         with nav_f2:
             if st.button("Abrir Fase 2 - Título", width="stretch", key="orq_to_f2"):
-                _switch_page("pages/02_Título.py")
+                switch_page("pages/02_Título.py")
         with nav_fail:
             if st.button("Abrir fase del fallo", width="stretch", key="orq_to_fail"):
                 page_map = {
@@ -366,10 +377,10 @@ if review_rows_detailed:
                     "translation": "pages/05_Sinopsis_ES.py",
                 }
                 page = page_map.get(selected_review_stage or "", "pages/02_Título.py")
-                _switch_page(page)
+                switch_page(page)
         with nav_all:
             if st.button("Abrir Orquestación", width="stretch", key="orq_to_orq"):
-                _switch_page("pages/00_Orquestación.py")
+                switch_page("pages/00_Orquestación.py")
 
 if selected_review_id:
     default_target = selected_review_id or default_target
@@ -394,9 +405,10 @@ with action_col1:
                     json={"reason": review_reason or None, "node": "manual"},
                     timeout=LONG_TIMEOUT_SECONDS,
                 )
+                invalidate_caches()
                 st.success("Marcado en revisión")
                 st.json(result)
-            except requests.exceptions.ReadTimeout:
+            except ApiTimeout:
                 st.error("Timeout marcando revisión")
             except Exception as exc:
                 st.error(str(exc))
@@ -434,9 +446,10 @@ with action_col2:
                     },
                     timeout=LONG_TIMEOUT_SECONDS,
                 )
+                invalidate_caches()
                 st.success("Acción ejecutada")
                 st.json(result)
-            except requests.exceptions.ReadTimeout:
+            except ApiTimeout:
                 st.error("Timeout ejecutando acción")
             except Exception as exc:
                 st.error(str(exc))
@@ -4,9 +4,9 @@ import pandas as pd
 import streamlit as st
 
 try:
-    from src.frontend.utils import api_get, api_post, configure_page, load_stats, render_icon_heading, render_timeout_controls
+    from src.frontend.utils import api_get, api_post, categorize_columns, configure_page, expander_is_open, invalidate_caches, lazy_expander, load_stats, render_icon_heading, render_limited_dataframe, render_timeout_controls
 except ModuleNotFoundError:  # pragma: no cover
-    from frontend.utils import api_get, api_post, configure_page, load_stats, render_icon_heading, render_timeout_controls
+    from frontend.utils import api_get, api_post, categorize_columns, configure_page, expander_is_open, invalidate_caches, lazy_expander, load_stats, render_icon_heading, render_limited_dataframe, render_timeout_controls
 
 configure_page()
 render_icon_heading("Fase 1 - Lectura", icon="images", level=1)
@@ -48,6 +48,7 @@ if st.button("Leer carpeta"):
                 "extensions": ext,
             },
         )
+        invalidate_caches()
         st.success("Lectura completada")
         st.json(result)
     except Exception as exc:
@@ -57,24 +58,26 @@ st.divider()
 
 st.info("La orquestación y la vista de grafo están en la página `Fase 0 - Orquestación LangGraph`.")
 
-render_icon_heading("Pendientes de extracción (detalle)", icon="list", level=2)
-try:
-    rows = api_get("/movies", params={"stage": "needs_extraction", "limit": 200})
-    if rows:
-        df = pd.DataFrame(rows)
-        st.dataframe(
-            df[
-                [
-                    "id",
-                    "image_path",
-                    "extraction_title",
-                    "workflow_status",
-                    "workflow_needs_review",
-                    "workflow_review_reason",
-                ]
-            ]
-        )
-    else:
-        st.info("No hay pendientes.")
-except Exception as exc:
-    st.error(str(exc))
+pending_box = lazy_expander("Pendientes de extracción (detalle)", key="read_pending_expander")
+with pending_box:
+    if expander_is_open(pending_box):
+        try:
+            rows = api_get("/movies", params={"stage": "needs_extraction", "limit": 200})
+            if rows:
+                df = pd.DataFrame.from_records(
+                    rows,
+                    columns=[
+                        "id",
+                        "image_path",
+                        "extraction_title",
+                        "workflow_status",
+                        "workflow_needs_review",
+                        "workflow_review_reason",
+                    ],
+                )
+                df = categorize_columns(df, ("workflow_status",))
+                render_limited_dataframe(df, key="read_pending_table")
+            else:
+                st.info("No hay pendientes.")
+        except Exception as exc:
+            st.error(str(exc))
@@ -1,43 +1,56 @@
 import os
+import re
 from pathlib import Path
 
-import requests
 import streamlit as st
-from PIL import Image, ImageOps
 
 try:
     from src.frontend.utils import (
-        LONG_TIMEOUT_SECONDS,
         WORKFLOW_STAGES,
-        api_get,
-        api_post,
         api_put,
         build_review_rerun_options,
         configure_page,
+        fragment,
+        invalidate_caches,
+        load_filtered_movies,
+        load_image_with_orientation,
+        load_movie,
+        load_movies,
         render_icon_heading,
+        render_job_status,
         infer_review_stage,
+        job_in_progress,
         node_ui_label,
         render_timeout_controls,
         select_movie_id,
         stage_ui_label,
         set_selected_movie_id,
+        start_job,
+        switch_page,
     )
 except ModuleNotFoundError:  # pragma: no cover
     from frontend.utils import (
-        LONG_TIMEOUT_SECONDS,
         WORKFLOW_STAGES,
-        api_get,
-        api_post,
         api_put,
         build_review_rerun_options,
         configure_page,
+        fragment,
+        invalidate_caches,
+        load_filtered_movies,
+        load_image_with_orientation,
+        load_movie,
+        load_movies,
         render_icon_heading,
+        render_job_status,
         infer_review_stage,
+        job_in_progress,
         node_ui_label,
         render_timeout_controls,
         select_movie_id,
         stage_ui_label,
         set_selected_movie_id,
+        start_job,
+        switch_page,
     )
 
 configure_page()
@@ -45,6 +58,8 @@ render_icon_heading("Fase 2 - Título", icon="pen-to-square", level=1)
 render_timeout_controls()
 
 PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT", Path(__file__).resolve().parents[3])).resolve()
+_TEAM_SPLIT = re.compile(r"[,\n]+")
+_MOVIE_SPLIT = re.compile(r";+")
 
 
 def _resolve_image_path(raw_path: str | None) -> Path | None:
@@ -57,29 +72,48 @@ def _resolve_image_path(raw_path: str | None) -> Path | None:
     return path.resolve()
 
 
-def _load_image_with_orientation(path: Path):
-    with Image.open(path) as image:
-        return ImageOps.exif_transpose(image).copy()
-
-
-def _switch_page(target: str) -> None:
-    switch_fn = getattr(st, "switch_page", None)
-    if callable(switch_fn):
-        switch_fn(target)
-    else:
-        st.info("Tu versión de Streamlit no soporta `switch_page`.")
-
-
 def _parse_team_input(team_text: str) -> list[str]:
     raw = str(team_text or "").replace("\r", "").strip()
     if not raw:
         return []
 
     # Multi-movie mode: each movie team block separated with ';'
-    if ";" in raw:
-        return [part.strip() for part in raw.split(";") if part.strip()]
+    splitter = _MOVIE_SPLIT if ";" in raw else _TEAM_SPLIT
+    return [part for part in (chunk.strip() for chunk in splitter.split(raw)) if part]
 
-    return [part.strip() for part in raw.replace("\n", ",").split(",") if part.strip()]
+
+@fragment
+def _review_form(selected_id: str, movie: dict) -> None:
+    # Submitting only reruns this block: the movie list, detail fetch and
+    # cover decode above are not repeated for a save.
+    default_title = movie.get("manual_title") or movie.get("extraction_title") or ""
+    default_team = ", ".join(movie.get("manual_team") or movie.get("extraction_team") or [])
+
+    with st.form(f"review_form_{selected_id}"):
+        title = st.text_input(
+            "Título revisado",
+            value=default_title,
+            key=f"review_title_{selected_id}_manual_title",
+        )
+        team_text = st.text_area(
+            "Equipo revisado (coma/salto de línea; usa ';' para separar por película)",
+            value=default_team,
+            height=120,
+            key=f"review_title_{selected_id}_manual_team",
+        )
+        save = st.form_submit_button("Guardar cambios")
+
+    if save:
+        team = _parse_team_input(team_text)
+        try:
+            result = api_put(
+                f"/movies/{selected_id}/title-team",
+                json={"title": title, "team": team},
+            )
+            invalidate_caches(result.get("movie"))
+            st.success("Guardado")
+        except Exception as exc:
+            st.error(str(exc))
 
 
 def _filter_rows(
@@ -88,18 +122,14 @@ def _filter_rows(
     mode: str,
 ) -> list[dict]:
     if mode == "review":
-        return [row for row in rows if row.get("workflow_needs_review")]
+        return load_filtered_movies(needs_review=True)
     if mode == "review_stage":
-        return [
-            row
-            for row in rows
-            if row.get("workflow_needs_review") and infer_review_stage(row) == "extraction"
-        ]
+        return load_filtered_movies(review_stage="extraction")
     return rows
 
 
 try:
-    rows = api_get("/movies", params={"limit": 5000})
+    rows = load_movies()
 except Exception as exc:
     st.error(str(exc))
     st.stop()
@@ -127,10 +157,14 @@ filter_mode = st.segmented_control(
 if filter_mode is None:
     filter_mode = "all"
 
-filtered_rows = _filter_rows(
-    rows,
-    mode=str(filter_mode),
-)
+try:
+    filtered_rows = _filter_rows(
+        rows,
+        mode=str(filter_mode),
+    )
+except Exception as exc:
+    st.error(str(exc))
+    st.stop()
 st.caption(
     f"Filtro actual: {mode_labels.get(str(filter_mode), 'Mostrar todas')} | "
     f"{len(filtered_rows)} de {len(rows)} películas"
@@ -145,33 +179,46 @@ selected_id = select_movie_id(
     label="Selecciona película",
     key="review_title_movie_selector",
 )
-movie_ids = [row["id"] for row in filtered_rows]
-current_index = movie_ids.index(selected_id)
-
+movie_ids: list[str] = []
+id_to_index: dict[str, int] = {}
+for index, row in enumerate(filtered_rows):
+    movie_ids.append(row["id"])
+    id_to_index[row["id"]] = index
+current_index = id_to_index[selected_id]
+
+last_index = len(movie_ids) - 1
 col_prev, col_next = st.columns(2)
 with col_prev:
-    if st.button("Anterior", disabled=current_index == 0, key="review_title_prev"):
-        set_selected_movie_id(movie_ids[current_index - 1])
-        st.rerun()
+    st.button(
+        "Anterior",
+        disabled=current_index == 0,
+        key="review_title_prev",
+        on_click=set_selected_movie_id,
+        args=(movie_ids[max(current_index - 1, 0)],),
+    )
 with col_next:
-    if st.button("Siguiente", disabled=current_index == len(movie_ids) - 1, key="review_title_next"):
-        set_selected_movie_id(movie_ids[current_index + 1])
-        st.rerun()
+    st.button(
+        "Siguiente",
+        disabled=current_index == last_index,
+        key="review_title_next",
+        on_click=set_selected_movie_id,
+        args=(movie_ids[min(current_index + 1, last_index)],),
+    )
 
 st.caption(f"Registro {current_index + 1} de {len(movie_ids)}")
 
 nav_imdb, nav_omdb, nav_plot = st.columns(3)
 with nav_imdb:
     if st.button("Ir a Fase 3 - IMDb", width="stretch", key="review_title_to_imdb"):
-        _switch_page("pages/03_IMDb.py")
+        switch_page("pages/03_IMDb.py")
 with nav_omdb:
     if st.button("Ir a Fase 4 - OMDb", width="stretch", key="review_title_to_omdb"):
-        _switch_page("pages/04_OMDb.py")
+        switch_page("pages/04_OMDb.py")
 with nav_plot:
     if st.button("Ir a Fase 5 - Sinopsis ES", width="stretch", key="review_title_to_plot"):
-        _switch_page("pages/05_Sinopsis_ES.py")
+        switch_page("pages/05_Sinopsis_ES.py")
 
-movie = api_get(f"/movies/{selected_id}")
+movie = load_movie(selected_id, filtered_rows)
 review_stage = infer_review_stage(movie)
 
 left, right = st.columns([1, 2])
@@ -181,7 +228,7 @@ with left:
     image_path = _resolve_image_path(movie.get("image_path"))
     if image_path:
         try:
-            st.image(_load_image_with_orientation(image_path), width="stretch")
+            st.image(load_image_with_orientation(image_path), width="stretch")
         except (FileNotFoundError, OSError) as exc:
             st.warning(f"No se pudo cargar la imagen: {exc}")
 
@@ -192,33 +239,7 @@ with right:
     if review_stage:
         st.caption(f"Origen de revisión detectado: `{stage_ui_label(review_stage)}`")
 
-    default_title = movie.get("manual_title") or movie.get("extraction_title") or ""
-    default_team = ", ".join(movie.get("manual_team") or movie.get("extraction_team") or [])
-
-    with st.form(f"review_form_{selected_id}"):
-        title = st.text_input(
-            "Título revisado",
-            value=default_title,
-            key=f"review_title_{selected_id}_manual_title",
-        )
-        team_text = st.text_area(
-            "Equipo revisado (coma/salto de línea; usa ';' para separar por película)",
-            value=default_team,
-            height=120,
-            key=f"review_title_{selected_id}_manual_team",
-        )
-        save = st.form_submit_button("Guardar cambios")
-
-    if save:
-        team = _parse_team_input(team_text)
-        try:
-            api_put(
-                f"/movies/{selected_id}/title-team",
-                json={"title": title, "team": team},
-            )
-            st.success("Guardado")
-        except Exception as exc:
-            st.error(str(exc))
+    _review_form(selected_id, movie)
 
 st.divider()
 
@@ -258,7 +279,10 @@ else:
     selected_option = st.selectbox("Reejecución disponible", option_labels, index=0)
     selected_start_stage = option_map[selected_option]
 
-    if st.button("Reejecutar workflow hasta la fase de revisión"):
+    if st.button(
+        "Reejecutar workflow hasta la fase de revisión",
+        disabled=job_in_progress("title_rerun_job"),
+    ):
         payload = {
             "movie_id": selected_id,
             "limit": 1,
@@ -267,17 +291,16 @@ else:
             "overwrite": True,
         }
         try:
-            result = api_post(
-                "/workflow/run",
-                json=payload,
-                timeout=LONG_TIMEOUT_SECONDS,
+            start_job(
+                "/jobs/workflow/run",
+                payload,
+                state_key="title_rerun_job",
+                done_message=(
+                    f"Workflow relanzado desde {stage_ui_label(selected_start_stage)} "
+                    f"hasta {stage_ui_label(review_stage)} para {selected_id}."
+                ),
             )
-            st.success(
-                f"Workflow relanzado desde {stage_ui_label(selected_start_stage)} "
-                f"hasta {stage_ui_label(review_stage)} para {selected_id}."
-            )
-            st.json(result)
-        except requests.exceptions.ReadTimeout:
-            st.error("Timeout relanzando workflow")
         except Exception as exc:
             st.error(str(exc))
+
+render_job_status("title_rerun_job")
@@ -1,65 +1,75 @@
 import pandas as pd
-import requests
 import streamlit as st
 
 try:
     from src.frontend.utils import (
-        LONG_TIMEOUT_SECONDS,
-        api_get,
-        api_post,
         api_put,
         build_review_rerun_options,
+        categorize_columns,
         configure_page,
+        expander_is_open,
+        invalidate_caches,
+        load_filtered_movies,
+        load_movie,
+        load_movies,
         render_icon_heading,
+        render_job_status,
+        render_limited_dataframe,
         render_movie_prev_next,
         infer_review_stage,
+        job_in_progress,
+        lazy_expander,
         node_ui_label,
         render_timeout_controls,
         select_movie_id,
         stage_ui_label,
+        start_job,
+        switch_page,
     )
 except ModuleNotFoundError:  # pragma: no cover
     from frontend.utils import (
-        LONG_TIMEOUT_SECONDS,
-        api_get,
-        api_post,
         api_put,
         build_review_rerun_options,
+        categorize_columns,
         configure_page,
+        expander_is_open,
+        invalidate_caches,
+        load_filtered_movies,
+        load_movie,
+        load_movies,
         render_icon_heading,
+        render_job_status,
+        render_limited_dataframe,
         render_movie_prev_next,
         infer_review_stage,
+        job_in_progress,
+        lazy_expander,
         node_ui_label,
         render_timeout_controls,
         select_movie_id,
         stage_ui_label,
+        start_job,
+        switch_page,
     )
 
 configure_page()
 render_icon_heading("Fase 3 - IMDb", icon="magnifying-glass", level=1)
 render_timeout_controls()
 
-def _switch_page(target: str) -> None:
-    switch_fn = getattr(st, "switch_page", None)
-    if callable(switch_fn):
-        switch_fn(target)
-    else:
-        st.info("Tu versión de Streamlit no soporta `switch_page`.")
-
-
 def _filter_rows(
     rows: list[dict],
     *,
     mode: str,
 ) -> list[dict]:
     if mode == "review":
-        return [row for row in rows if row.get("workflow_needs_review")]
+        return load_filtered_movies(needs_review=True)
     if mode == "review_stage":
+        # Two stages share this view; the review list is small, so the stage
+        # split runs here over the cached server-side result.
         return [
             row
-            for row in rows
-            if row.get("workflow_needs_review")
-            and infer_review_stage(row) in {"imdb", "title_es"}
+            for row in load_filtered_movies(needs_review=True)
+            if infer_review_stage(row) in {"imdb", "title_es"}
         ]
     return rows
 
@@ -110,13 +120,60 @@ def _needs_imdb_title_fields(row: dict) -> bool:
     return False
 
 
-def _with_ui_stage(rows: list[dict]) -> list[dict]:
-    out: list[dict] = []
-    for row in rows:
-        clone = dict(row)
-        clone["pipeline_stage_ui"] = stage_ui_label(row.get("pipeline_stage"))
-        out.append(clone)
-    return out
+def _with_ui_stage(df: pd.DataFrame) -> pd.DataFrame:
+    return df.assign(pipeline_stage=df["pipeline_stage"].map(stage_ui_label))
+
+
+def _render_pending_tables(rows: list[dict]) -> None:
+    movies_df = pd.DataFrame.from_records(
+        rows,
+        columns=[
+            "id",
+            "pipeline_stage",
+            "manual_title",
+            "extraction_title",
+            "imdb_url",
+            "imdb_status",
+            "imdb_title_es_status",
+            "imdb_title_es_last_error",
+        ],
+    )
+    movies_df = categorize_columns(
+        movies_df, ("pipeline_stage", "imdb_status", "imdb_title_es_status")
+    )
+    imdb_urls = movies_df["imdb_url"]
+    pending_df = movies_df.loc[
+        imdb_urls.isna() | (imdb_urls == ""),
+        ["id", "pipeline_stage", "manual_title", "extraction_title", "imdb_status"],
+    ]
+    if not pending_df.empty:
+        st.write(f"Pendientes IMDb: {len(pending_df)}")
+        render_limited_dataframe(
+            _with_ui_stage(pending_df), key="imdb_pending_table", width="stretch"
+        )
+    else:
+        st.caption("Sin pendientes de búsqueda IMDb.")
+
+    pending_title_es_df = movies_df.loc[
+        [_needs_imdb_title_fields(row) for row in rows],
+        [
+            "id",
+            "pipeline_stage",
+            "imdb_status",
+            "imdb_title_es_status",
+            "imdb_title_es_last_error",
+        ],
+    ]
+    if not pending_title_es_df.empty:
+        st.write(f"Pendientes título ES IMDb: {len(pending_title_es_df)}")
+        render_limited_dataframe(
+            _with_ui_stage(pending_title_es_df),
+            key="imdb_pending_title_es_table",
+            width="stretch",
+        )
+    else:
+        st.caption("Sin pendientes de título ES.")
+
 
 render_icon_heading("Acciones por lote (opcional)", icon="list", level=2)
 with st.expander("Búsqueda y extracción por lote", expanded=False):
@@ -132,32 +189,32 @@ with st.expander("Búsqueda y extracción por lote", expanded=False):
 
     run_col1, run_col2 = st.columns(2)
     with run_col1:
-        if st.button("Ejecutar búsqueda IMDb"):
+        if st.button(
+            "Ejecutar búsqueda IMDb",
+            disabled=job_in_progress("imdb_batch_search_job"),
+        ):
             try:
-                result = api_post(
-                    "/imdb/search",
-                    json={
+                start_job(
+                    "/jobs/imdb/search",
+                    {
                         "movie_id": movie_id or None,
                         "limit": int(limit),
                         "overwrite": overwrite,
                         "max_results": int(max_results),
                     },
-                    timeout=LONG_TIMEOUT_SECONDS,
-                )
-                st.success("Búsqueda completada")
-                st.json(result)
-                st.rerun()
-            except requests.exceptions.ReadTimeout:
-                st.error(
-                    "Timeout esperando al backend. "
-                    "Reduce el límite del lote o cambia el modo en Sidebar > HTTP timeout."
+                    state_key="imdb_batch_search_job",
+                    done_message="Búsqueda completada",
                 )
             except Exception as exc:
                 st.error(str(exc))
+        render_job_status("imdb_batch_search_job")
 
     with run_col2:
         overwrite_title_es = st.checkbox("Reextraer título ES", value=False)
-        if st.button("Extraer título ES IMDb (batch)"):
+        if st.button(
+            "Extraer título ES IMDb (batch)",
+            disabled=job_in_progress("imdb_batch_title_es_job"),
+        ):
             payload = {
                 "movie_id": movie_id or None,
                 "limit": int(limit),
@@ -167,19 +224,20 @@ with st.expander("Búsqueda y extracción por lote", expanded=False):
                 "max_results": int(max_results),
             }
             try:
-                result = api_post("/workflow/run", json=payload, timeout=LONG_TIMEOUT_SECONDS)
-                st.success("Extracción de título ES completada")
-                st.json(result)
-                st.rerun()
-            except requests.exceptions.ReadTimeout:
-                st.error("Timeout extrayendo título ES IMDb.")
+                start_job(
+                    "/jobs/workflow/run",
+                    payload,
+                    state_key="imdb_batch_title_es_job",
+                    done_message="Extracción de título ES completada",
+                )
             except Exception as exc:
                 st.error(str(exc))
+        render_job_status("imdb_batch_title_es_job")
 
 st.divider()
 
 try:
-    rows = api_get("/movies", params={"limit": 5000})
+    rows = load_movies()
 except Exception as exc:
     st.error(str(exc))
     st.stop()
@@ -188,38 +246,10 @@ if not rows:
     st.info("No hay películas")
     st.stop()
 
-with st.expander("Pendientes de fase IMDb", expanded=False):
-    pending = [row for row in rows if not row.get("imdb_url")]
-    if pending:
-        st.write(f"Pendientes IMDb: {len(pending)}")
-        pending_df_rows = _with_ui_stage(pending)
-        st.dataframe(
-            pd.DataFrame(pending_df_rows)[
-                ["id", "pipeline_stage_ui", "manual_title", "extraction_title", "imdb_status"]
-            ].rename(columns={"pipeline_stage_ui": "pipeline_stage"}),
-            width="stretch",
-        )
-    else:
-        st.caption("Sin pendientes de búsqueda IMDb.")
-
-    pending_title_es = [row for row in rows if _needs_imdb_title_fields(row)]
-    if pending_title_es:
-        st.write(f"Pendientes título ES IMDb: {len(pending_title_es)}")
-        pending_titles_df_rows = _with_ui_stage(pending_title_es)
-        st.dataframe(
-            pd.DataFrame(pending_titles_df_rows)[
-                [
-                    "id",
-                    "pipeline_stage_ui",
-                    "imdb_status",
-                    "imdb_title_es_status",
-                    "imdb_title_es_last_error",
-                ]
-            ].rename(columns={"pipeline_stage_ui": "pipeline_stage"}),
-            width="stretch",
-        )
-    else:
-        st.caption("Sin pendientes de título ES.")
+pending_box = lazy_expander("Pendientes de fase IMDb", key="imdb_pending_expander")
+with pending_box:
+    if expander_is_open(pending_box):
+        _render_pending_tables(rows)
 
 mode_labels = {
     "all": "Mostrar todas",
@@ -240,10 +270,14 @@ filter_mode = st.segmented_control(
 if filter_mode is None:
     filter_mode = "all"
 
-filtered_rows = _filter_rows(
-    rows,
-    mode=str(filter_mode),
-)
+try:
+    filtered_rows = _filter_rows(
+        rows,
+        mode=str(filter_mode),
+    )
+except Exception as exc:
+    st.error(str(exc))
+    st.stop()
 st.caption(
     f"Filtro actual: {mode_labels.get(str(filter_mode), 'Mostrar todas')} | "
     f"{len(filtered_rows)} de {len(rows)} películas"
@@ -260,15 +294,15 @@ render_movie_prev_next(filtered_rows, selected_id, key_prefix="imdb_movie")
 nav_f2, nav_f4, nav_f5 = st.columns(3)
 with nav_f2:
     if st.button("Ir a Fase 2 - Título", width="stretch", key="imdb_to_f2"):
-        _switch_page("pages/02_Título.py")
+        switch_page("pages/02_Título.py")
 with nav_f4:
     if st.button("Ir a Fase 4 - OMDb", width="stretch", key="imdb_to_f4"):
-        _switch_page("pages/04_OMDb.py")
+        switch_page("pages/04_OMDb.py")
 with nav_f5:
     if st.button("Ir a Fase 5 - Sinopsis ES", width="stretch", key="imdb_to_f5"):
-        _switch_page("pages/05_Sinopsis_ES.py")
+        switch_page("pages/05_Sinopsis_ES.py")
 
-movie = api_get(f"/movies/{selected_id}")
+movie = load_movie(selected_id, filtered_rows)
 review_stage = infer_review_stage(movie)
 
 render_icon_heading("Acciones sobre película seleccionada", icon="film", level=2)
@@ -304,41 +338,43 @@ with right:
 
     action_c1, action_c2 = st.columns(2)
     with action_c1:
-        if st.button("Buscar IMDb solo este ID", width="stretch"):
+        if st.button(
+            "Buscar IMDb solo este ID",
+            width="stretch",
+            disabled=job_in_progress("imdb_single_search_job"),
+        ):
             try:
-                result = api_post(
-                    "/imdb/search",
-                    json={"movie_id": selected_id, "limit": 1, "overwrite": True, "max_results": int(max_results)},
-                    timeout=LONG_TIMEOUT_SECONDS,
+                start_job(
+                    "/jobs/imdb/search",
+                    {"movie_id": selected_id, "limit": 1, "overwrite": True, "max_results": int(max_results)},
+                    state_key="imdb_single_search_job",
+                    done_message=f"Búsqueda completada para {selected_id}",
                 )
-                st.success("Búsqueda completada")
-                st.json(result)
-                st.rerun()
-            except requests.exceptions.ReadTimeout:
-                st.error("Timeout esperando al backend para este ID. Prueba Sidebar > HTTP timeout.")
             except Exception as exc:
                 st.error(str(exc))
+        render_job_status("imdb_single_search_job")
     with action_c2:
-        if st.button("Extraer título ES solo este ID", width="stretch"):
+        if st.button(
+            "Extraer título ES solo este ID",
+            width="stretch",
+            disabled=job_in_progress("imdb_single_title_es_job"),
+        ):
             try:
-                result = api_post(
-                    "/workflow/run",
-                    json={
+                start_job(
+                    "/jobs/workflow/run",
+                    {
                         "movie_id": selected_id,
                         "limit": 1,
                         "start_stage": "title_es",
                         "stop_after": "title_es",
                         "overwrite": True,
                     },
-                    timeout=LONG_TIMEOUT_SECONDS,
+                    state_key="imdb_single_title_es_job",
+                    done_message=f"Extracción de título ES completada para {selected_id}",
                 )
-                st.success("Extracción de título ES completada")
-                st.json(result)
-                st.rerun()
-            except requests.exceptions.ReadTimeout:
-                st.error("Timeout extrayendo título ES para este ID.")
             except Exception as exc:
                 st.error(str(exc))
+        render_job_status("imdb_single_title_es_job")
 
     url_c1, url_c2 = st.columns([3, 1])
     with url_c1:
@@ -350,7 +386,8 @@ with right:
     with url_c2:
         if st.button("Guardar URL", width="stretch"):
             try:
-                api_put(f"/movies/{selected_id}/imdb", json={"imdb_url": manual_url})
+                result = api_put(f"/movies/{selected_id}/imdb", json={"imdb_url": manual_url})
+                invalidate_caches(result.get("movie"))
                 st.success("IMDb guardado")
                 st.rerun()
             except Exception as exc:
@@ -368,10 +405,11 @@ with right:
     with save_c1:
         if st.button("Guardar título ES", width="stretch"):
             try:
-                api_put(
+                result = api_put(
                     f"/movies/{selected_id}/imdb-title-es",
                     json={"title_es": manual_title_es},
                 )
+                invalidate_caches(result.get("movie"))
                 st.success("Título ES guardado")
                 st.rerun()
             except Exception as exc:
@@ -389,7 +427,11 @@ else:
     selected_option = st.selectbox("Reejecución disponible", option_labels, index=0, key="imdb_rerun_option")
     selected_start_stage = option_map[selected_option]
 
-    if st.button("Reejecutar workflow hasta revisión", key="imdb_rerun_btn"):
+    if st.button(
+        "Reejecutar workflow hasta revisión",
+        key="imdb_rerun_btn",
+        disabled=job_in_progress("imdb_rerun_job"),
+    ):
         payload = {
             "movie_id": selected_id,
             "limit": 1,
@@ -398,11 +440,13 @@ else:
             "overwrite": True,
         }
         try:
-            result = api_post("/workflow/run", json=payload, timeout=LONG_TIMEOUT_SECONDS)
-            st.success(f"Workflow relanzado desde {selected_start_stage} hasta {stage_target}.")
-            st.json(result)
-            st.rerun()
-        except requests.exceptions.ReadTimeout:
-            st.error("Timeout relanzando workflow")
+            start_job(
+                "/jobs/workflow/run",
+                payload,
+                state_key="imdb_rerun_job",
+                done_message=f"Workflow relanzado desde {selected_start_stage} hasta {stage_target}.",
+            )
         except Exception as exc:
             st.error(str(exc))
+
+render_job_status("imdb_rerun_job")
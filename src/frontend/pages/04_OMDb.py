@@ -1,34 +1,43 @@
-import requests
 import streamlit as st
 from urllib.parse import urlparse
 
 try:
     from src.frontend.utils import (
+        ApiTimeout,
         LONG_TIMEOUT_SECONDS,
-        api_get,
         api_post,
         api_put,
         build_review_rerun_options,
         configure_page,
+        fragment,
+        invalidate_caches,
+        load_filtered_movies,
+        load_movie,
         render_icon_heading,
         render_movie_prev_next,
         infer_review_stage,
         render_timeout_controls,
         select_movie_id,
+        switch_page,
     )
 except ModuleNotFoundError:  # pragma: no cover
     from frontend.utils import (
+        ApiTimeout,
         LONG_TIMEOUT_SECONDS,
-        api_get,
         api_post,
         api_put,
         build_review_rerun_options,
         configure_page,
+        fragment,
+        invalidate_caches,
+        load_filtered_movies,
+        load_movie,
         render_icon_heading,
         render_movie_prev_next,
         infer_review_stage,
         render_timeout_controls,
         select_movie_id,
+        switch_page,
     )
 
 configure_page()
@@ -36,26 +45,12 @@ render_icon_heading("Fase 4 - OMDb", icon="database", level=1)
 render_timeout_controls()
 
 
-def _switch_page(target: str) -> None:
-    switch_fn = getattr(st, "switch_page", None)
-    if callable(switch_fn):
-        switch_fn(target)
-    else:
-        st.info("Tu versión de Streamlit no soporta `switch_page`.")
-
-
-def _filter_rows(
-    rows: list[dict],
-    *,
-    mode: str,
-) -> list[dict]:
+def _filter_rows(mode: str) -> list[dict]:
     if mode == "review":
-        return [row for row in rows if row.get("workflow_needs_review")]
+        return load_filtered_movies(has_imdb_id=True, needs_review=True)
     if mode == "review_stage":
-        return [
-            row for row in rows if row.get("workflow_needs_review") and infer_review_stage(row) == "omdb"
-        ]
-    return rows
+        return load_filtered_movies(has_imdb_id=True, review_stage="omdb")
+    return load_filtered_movies(has_imdb_id=True)
 
 
 def _split_semicolon_keep_empty(raw_value: str | None) -> list[str]:
@@ -80,125 +75,9 @@ def _split_poster_urls(raw_value: str | None) -> list[tuple[int, str]]:
     return urls
 
 
-render_icon_heading("Acciones por lote (opcional)", icon="list", level=2)
-with st.expander("Descargar OMDb por lote", expanded=False):
-    batch_c1, batch_c2, batch_c3 = st.columns([2, 1, 1])
-    with batch_c1:
-        movie_id = st.text_input("ID concreto (opcional)", value="")
-    with batch_c2:
-        limit = st.number_input("Límite batch", min_value=1, max_value=5000, value=20)
-    with batch_c3:
-        overwrite = st.checkbox("Volver a descargar", value=False)
-
-    if st.button("Descargar OMDb (batch)"):
-        try:
-            result = api_post(
-                "/omdb/fetch",
-                json={
-                    "movie_id": movie_id or None,
-                    "limit": int(limit),
-                    "overwrite": overwrite,
-                },
-                timeout=LONG_TIMEOUT_SECONDS,
-            )
-            st.success("Descarga de OMDb completada")
-            st.json(result)
-        except requests.exceptions.ReadTimeout:
-            st.error(
-                "Timeout esperando al backend. "
-                "Reduce el límite del lote o cambia el modo en Sidebar > HTTP timeout."
-            )
-        except Exception as exc:
-            st.error(str(exc))
-
-st.divider()
-
-rows = api_get("/movies", params={"limit": 5000})
-rows_with_imdb = [row for row in rows if row.get("imdb_id")]
-if not rows_with_imdb:
-    st.info("No hay películas con IMDb ID")
-    st.stop()
-
-mode_labels = {
-    "all": "Mostrar todas",
-    "review": "Solo en revisión",
-    "review_stage": "Solo revisión de OMDb",
-}
-if "omdb_filter_mode" not in st.session_state:
-    st.session_state["omdb_filter_mode"] = "all"
-
-filter_mode = st.segmented_control(
-    "Filtro",
-    options=list(mode_labels.keys()),
-    default=st.session_state["omdb_filter_mode"],
-    format_func=lambda value: mode_labels.get(str(value), str(value)),
-    key="omdb_filter_mode",
-    width="stretch",
-)
-if filter_mode is None:
-    filter_mode = "all"
-
-filtered_rows = _filter_rows(
-    rows_with_imdb,
-    mode=str(filter_mode),
-)
-st.caption(
-    f"Filtro actual: {mode_labels.get(str(filter_mode), 'Mostrar todas')} | "
-    f"{len(filtered_rows)} de {len(rows_with_imdb)} películas"
-)
-
-if not filtered_rows:
-    st.info("No hay películas con los filtros actuales.")
-    st.stop()
-
-selected_id = select_movie_id(filtered_rows, label="Película", key="omdb_movie_selector")
-render_movie_prev_next(filtered_rows, selected_id, key_prefix="omdb_movie")
-
-
-nav_f2, nav_f3, nav_f5 = st.columns(3)
-with nav_f2:
-    if st.button("Ir a Fase 2 - Título", width="stretch", key="omdb_to_f2"):
-        _switch_page("pages/02_Título.py")
-with nav_f3:
-    if st.button("Ir a Fase 3 - IMDb", width="stretch", key="omdb_to_f3"):
-        _switch_page("pages/03_IMDb.py")
-with nav_f5:
-    if st.button("Ir a Fase 5 - Sinopsis ES", width="stretch", key="omdb_to_f5"):
-        _switch_page("pages/05_Sinopsis_ES.py")
-
-movie = api_get(f"/movies/{selected_id}")
-review_stage = infer_review_stage(movie)
-
-render_icon_heading("Acciones sobre película seleccionada", icon="film", level=2)
-st.write("IMDb ID:", movie.get("imdb_id") or "")
-st.write("Estado OMDb:", movie.get("omdb_status") or "")
-if review_stage:
-    st.caption(f"Origen de revisión detectado: `{review_stage}`")
-if movie.get("omdb_last_error"):
-    st.warning(movie.get("omdb_last_error"))
-if movie.get("workflow_needs_review"):
-    st.warning(movie.get("workflow_review_reason") or "Pendiente de revisión")
-
-if st.button("Descargar OMDb solo este ID", key="omdb_fetch_single_btn"):
-    try:
-        result = api_post(
-            "/omdb/fetch",
-            json={
-                "movie_id": selected_id,
-                "limit": 1,
-                "overwrite": True,
-            },
-            timeout=LONG_TIMEOUT_SECONDS,
-        )
-        st.success("Descarga de OMDb completada para la película seleccionada")
-        st.json(result)
-    except requests.exceptions.ReadTimeout:
-        st.error("Timeout esperando al backend para este ID. Prueba Sidebar > HTTP timeout.")
-    except Exception as exc:
-        st.error(str(exc))
-
-form_col, poster_col = st.columns([2.25, 1.0], gap="large")
-with form_col:
+@fragment
+def _omdb_review_form(selected_id: str, movie: dict) -> None:
+    # Saving only reruns the form, not the list and detail loads above.
     with st.form("omdb_review"):
         b1_c1, b1_c2, b1_c3 = st.columns([2.2, 0.8, 1.0])
         with b1_c1:
@@ -232,7 +111,35 @@ with form_col:
 
         save = st.form_submit_button("Guardar cambios")
 
-with poster_col:
+    if save:
+        try:
+            result = api_put(
+                f"/movies/{selected_id}/omdb",
+                json={
+                    "fields": {
+                        "omdb_title": omdb_title,
+                        "omdb_year": omdb_year,
+                        "omdb_type": omdb_type,
+                        "omdb_runtime": omdb_runtime,
+                        "omdb_genre": omdb_genre,
+                        "omdb_director": omdb_director,
+                        "omdb_writer": omdb_writer,
+                        "omdb_actors": omdb_actors,
+                        "omdb_language": omdb_language,
+                        "omdb_country": omdb_country,
+                        "omdb_plot_en": omdb_plot_en,
+                    }
+                },
+            )
+            invalidate_caches(result.get("movie"))
+            st.success("OMDb actualizado")
+        except Exception as exc:
+            st.error(str(exc))
+
+
+@fragment
+def _poster_panel(selected_id: str, movie: dict) -> None:
+    # Stepping through posters reruns only this panel.
     st.markdown("**Portada OMDb**")
     title_slots = _split_semicolon_keep_empty(movie.get("omdb_title"))
     poster_raw_slots = _split_semicolon_keep_empty(movie.get("omdb_poster"))
@@ -308,30 +215,128 @@ with poster_col:
                     with st.expander("Ver errores de descarga"):
                         st.dataframe(errors, width="stretch", hide_index=True)
 
-if save:
+
+render_icon_heading("Acciones por lote (opcional)", icon="list", level=2)
+with st.expander("Descargar OMDb por lote", expanded=False):
+    batch_c1, batch_c2, batch_c3 = st.columns([2, 1, 1])
+    with batch_c1:
+        movie_id = st.text_input("ID concreto (opcional)", value="")
+    with batch_c2:
+        limit = st.number_input("Límite batch", min_value=1, max_value=5000, value=20)
+    with batch_c3:
+        overwrite = st.checkbox("Volver a descargar", value=False)
+
+    if st.button("Descargar OMDb (batch)"):
+        try:
+            result = api_post(
+                "/omdb/fetch",
+                json={
+                    "movie_id": movie_id or None,
+                    "limit": int(limit),
+                    "overwrite": overwrite,
+                },
+                timeout=LONG_TIMEOUT_SECONDS,
+            )
+            invalidate_caches()
+            st.success("Descarga de OMDb completada")
+            st.json(result)
+        except ApiTimeout:
+            st.error(
+                "Timeout esperando al backend. "
+                "Reduce el límite del lote o cambia el modo en Sidebar > HTTP timeout."
+            )
+        except Exception as exc:
+            st.error(str(exc))
+
+st.divider()
+
+rows_with_imdb = load_filtered_movies(has_imdb_id=True)
+if not rows_with_imdb:
+    st.info("No hay películas con IMDb ID")
+    st.stop()
+
+mode_labels = {
+    "all": "Mostrar todas",
+    "review": "Solo en revisión",
+    "review_stage": "Solo revisión de OMDb",
+}
+if "omdb_filter_mode" not in st.session_state:
+    st.session_state["omdb_filter_mode"] = "all"
+
+filter_mode = st.segmented_control(
+    "Filtro",
+    options=list(mode_labels.keys()),
+    default=st.session_state["omdb_filter_mode"],
+    format_func=lambda value: mode_labels.get(str(value), str(value)),
+    key="omdb_filter_mode",
+    width="stretch",
+)
+if filter_mode is None:
+    filter_mode = "all"
+
+filtered_rows = _filter_rows(str(filter_mode))
+st.caption(
+    f"Filtro actual: {mode_labels.get(str(filter_mode), 'Mostrar todas')} | "
+    f"{len(filtered_rows)} de {len(rows_with_imdb)} películas"
+)
+
+if not filtered_rows:
+    st.info("No hay películas con los filtros actuales.")
+    st.stop()
+
+selected_id = select_movie_id(filtered_rows, label="Película", key="omdb_movie_selector")
+render_movie_prev_next(filtered_rows, selected_id, key_prefix="omdb_movie")
+
+
+nav_f2, nav_f3, nav_f5 = st.columns(3)
+with nav_f2:
+    if st.button("Ir a Fase 2 - Título", width="stretch", key="omdb_to_f2"):
+        switch_page("pages/02_Título.py")
+with nav_f3:
+    if st.button("Ir a Fase 3 - IMDb", width="stretch", key="omdb_to_f3"):
+        switch_page("pages/03_IMDb.py")
+with nav_f5:
+    if st.button("Ir a Fase 5 - Sinopsis ES", width="stretch", key="omdb_to_f5"):
+        switch_page("pages/05_Sinopsis_ES.py")
+
+movie = load_movie(selected_id, filtered_rows)
+review_stage = infer_review_stage(movie)
+
+render_icon_heading("Acciones sobre película seleccionada", icon="film", level=2)
+st.write("IMDb ID:", movie.get("imdb_id") or "")
+st.write("Estado OMDb:", movie.get("omdb_status") or "")
+if review_stage:
+    st.caption(f"Origen de revisión detectado: `{review_stage}`")
+if movie.get("omdb_last_error"):
+    st.warning(movie.get("omdb_last_error"))
+if movie.get("workflow_needs_review"):
+    st.warning(movie.get("workflow_review_reason") or "Pendiente de revisión")
+
+if st.button("Descargar OMDb solo este ID", key="omdb_fetch_single_btn"):
     try:
-        api_put(
-            f"/movies/{selected_id}/omdb",
+        result = api_post(
+            "/omdb/fetch",
             json={
-                "fields": {
-                    "omdb_title": omdb_title,
-                    "omdb_year": omdb_year,
-                    "omdb_type": omdb_type,
-                    "omdb_runtime": omdb_runtime,
-                    "omdb_genre": omdb_genre,
-                    "omdb_director": omdb_director,
-                    "omdb_writer": omdb_writer,
-                    "omdb_actors": omdb_actors,
-                    "omdb_language": omdb_language,
-                    "omdb_country": omdb_country,
-                    "omdb_plot_en": omdb_plot_en,
-                }
+                "movie_id": selected_id,
+                "limit": 1,
+                "overwrite": True,
             },
+            timeout=LONG_TIMEOUT_SECONDS,
         )
-        st.success("OMDb actualizado")
+        invalidate_caches()
+        st.success("Descarga de OMDb completada para la película seleccionada")
+        st.json(result)
+    except ApiTimeout:
+        st.error("Timeout esperando al backend para este ID. Prueba Sidebar > HTTP timeout.")
     except Exception as exc:
         st.error(str(exc))
 
+form_col, poster_col = st.columns([2.25, 1.0], gap="large")
+with form_col:
+    _omdb_review_form(selected_id, movie)
+with poster_col:
+    _poster_panel(selected_id, movie)
+
 if movie.get("omdb_raw"):
     with st.expander("Ver OMDb raw"):
         st.json(movie["omdb_raw"])
@@ -358,9 +363,10 @@ else:
         }
         try:
             result = api_post("/workflow/run", json=payload, timeout=LONG_TIMEOUT_SECONDS)
+            invalidate_caches()
             st.success(f"Workflow relanzado desde {selected_start_stage} hasta {stage_target}.")
             st.json(result)
-        except requests.exceptions.ReadTimeout:
+        except ApiTimeout:
             st.error("Timeout relanzando workflow")
         except Exception as exc:
             st.error(str(exc))
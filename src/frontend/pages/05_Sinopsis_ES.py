@@ -1,37 +1,46 @@
 import os
 
-import requests
 import streamlit as st
 
 try:
     from src.frontend.utils import (
+        ApiTimeout,
         LONG_TIMEOUT_SECONDS,
-        api_get,
         api_post,
         api_put,
         build_review_rerun_options,
         configure_page,
+        fragment,
+        invalidate_caches,
+        load_filtered_movies,
+        load_movie,
         render_icon_heading,
         render_movie_prev_next,
         infer_review_stage,
         render_timeout_controls,
         select_movie_id,
         select_ollama_model,
+        switch_page,
     )
 except ModuleNotFoundError:  # pragma: no cover
     from frontend.utils import (
+        ApiTimeout,
         LONG_TIMEOUT_SECONDS,
-        api_get,
         api_post,
         api_put,
         build_review_rerun_options,
         configure_page,
+        fragment,
+        invalidate_caches,
+        load_filtered_movies,
+        load_movie,
         render_icon_heading,
         render_movie_prev_next,
         infer_review_stage,
         render_timeout_controls,
         select_movie_id,
         select_ollama_model,
+        switch_page,
     )
 
 configure_page()
@@ -39,28 +48,34 @@ render_icon_heading("Fase 5 - Traducción de sinopsis", icon="language", level=1
 render_timeout_controls()
 
 
-def _switch_page(target: str) -> None:
-    switch_fn = getattr(st, "switch_page", None)
-    if callable(switch_fn):
-        switch_fn(target)
-    else:
-        st.info("Tu versión de Streamlit no soporta `switch_page`.")
-
-
-def _filter_rows(
-    rows: list[dict],
-    *,
-    mode: str,
-) -> list[dict]:
+def _filter_rows(mode: str) -> list[dict]:
     if mode == "review":
-        return [row for row in rows if row.get("workflow_needs_review")]
+        return load_filtered_movies(has_plot_en=True, needs_review=True)
     if mode == "review_stage":
-        return [
-            row
-            for row in rows
-            if row.get("workflow_needs_review") and infer_review_stage(row) == "translation"
-        ]
-    return rows
+        return load_filtered_movies(has_plot_en=True, review_stage="translation")
+    return load_filtered_movies(has_plot_en=True)
+
+
+@fragment
+def _plot_es_editor(selected_id: str, movie: dict) -> None:
+    # Saving only reruns the editor, not the list and detail loads above.
+    render_icon_heading("Sinopsis traducida (ES)", icon="language", level=3)
+    # Inside a form, editing the text no longer reruns on every blur.
+    with st.form(f"plot_es_form_{selected_id}", clear_on_submit=False, border=False):
+        plot_es = st.text_area(
+            "ES",
+            value=movie.get("omdb_plot_es") or "",
+            height=240,
+            key=f"plot_es_edit_{selected_id}",
+        )
+        save = st.form_submit_button("Guardar traducción manual")
+    if save:
+        try:
+            result = api_put(f"/movies/{selected_id}/plot-es", json={"plot_es": plot_es})
+            invalidate_caches(result.get("movie"))
+            st.success("Traducción guardada")
+        except Exception as exc:
+            st.error(str(exc))
 
 
 render_icon_heading("Acciones por lote (opcional)", icon="list", level=2)
@@ -91,9 +106,10 @@ with st.expander("Traducir sinopsis por lote", expanded=False):
                 },
                 timeout=LONG_TIMEOUT_SECONDS,
             )
+            invalidate_caches()
             st.success("Traducción completada")
             st.json(result)
-        except requests.exceptions.ReadTimeout:
+        except ApiTimeout:
             st.error(
                 "Timeout esperando al backend. "
                 "Reduce el límite del lote o cambia el modo en Sidebar > HTTP timeout."
@@ -103,8 +119,7 @@ with st.expander("Traducir sinopsis por lote", expanded=False):
 
 st.divider()
 
-rows = api_get("/movies", params={"limit": 5000})
-rows_with_plot = [row for row in rows if row.get("omdb_plot_en")]
+rows_with_plot = load_filtered_movies(has_plot_en=True)
 
 if not rows_with_plot:
     st.info("No hay sinopsis en inglés disponibles")
@@ -129,10 +144,7 @@ filter_mode = st.segmented_control(
 if filter_mode is None:
     filter_mode = "all"
 
-filtered_rows = _filter_rows(
-    rows_with_plot,
-    mode=str(filter_mode),
-)
+filtered_rows = _filter_rows(str(filter_mode))
 st.caption(
     f"Filtro actual: {mode_labels.get(str(filter_mode), 'Mostrar todas')} | "
     f"{len(filtered_rows)} de {len(rows_with_plot)} películas"
@@ -149,15 +161,15 @@ render_movie_prev_next(filtered_rows, selected_id, key_prefix="plot_movie")
 nav_f2, nav_f3, nav_f4 = st.columns(3)
 with nav_f2:
     if st.button("Ir a Fase 2 - Título", width="stretch", key="plot_to_f2"):
-        _switch_page("pages/02_Título.py")
+        switch_page("pages/02_Título.py")
 with nav_f3:
     if st.button("Ir a Fase 3 - IMDb", width="stretch", key="plot_to_f3"):
-        _switch_page("pages/03_IMDb.py")
+        switch_page("pages/03_IMDb.py")
 with nav_f4:
     if st.button("Ir a Fase 4 - OMDb", width="stretch", key="plot_to_f4"):
-        _switch_page("pages/04_OMDb.py")
+        switch_page("pages/04_OMDb.py")
 
-movie = api_get(f"/movies/{selected_id}")
+movie = load_movie(selected_id, filtered_rows)
 review_stage = infer_review_stage(movie)
 
 render_icon_heading("Acciones sobre película seleccionada", icon="film", level=2)
@@ -191,27 +203,16 @@ with plot_c1:
                 },
                 timeout=LONG_TIMEOUT_SECONDS,
             )
+            invalidate_caches()
             st.success("Traducción completada")
             st.json(result)
-        except requests.exceptions.ReadTimeout:
+        except ApiTimeout:
             st.error("Timeout esperando al backend para este ID. Prueba Sidebar > HTTP timeout.")
         except Exception as exc:
             st.error(str(exc))
 
 with plot_c2:
-    render_icon_heading("Sinopsis traducida (ES)", icon="language", level=3)
-    plot_es = st.text_area(
-        "ES",
-        value=movie.get("omdb_plot_es") or "",
-        height=240,
-        key=f"plot_es_edit_{selected_id}",
-    )
-    if st.button("Guardar traducción manual"):
-        try:
-            api_put(f"/movies/{selected_id}/plot-es", json={"plot_es": plot_es})
-            st.success("Traducción guardada")
-        except Exception as exc:
-            st.error(str(exc))
+    _plot_es_editor(selected_id, movie)
 
 st.divider()
 render_icon_heading("Reejecución acotada hasta revisión", icon="rotate-right", level=2)
@@ -235,9 +236,10 @@ else:
         }
         try:
             result = api_post("/workflow/run", json=payload, timeout=LONG_TIMEOUT_SECONDS)
+            invalidate_caches()
             st.success(f"Workflow relanzado desde {selected_start_stage} hasta {stage_target}.")
             st.json(result)
-        except requests.exceptions.ReadTimeout:
+        except ApiTimeout:
             st.error("Timeout relanzando workflow")
         except Exception as exc:
             st.error(str(exc))
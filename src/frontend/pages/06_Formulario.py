@@ -3,7 +3,6 @@ from pathlib import Path
 from typing import Any
 
 import streamlit as st
-from PIL import Image, ImageOps
 
 try:
     from src.frontend.tc_sections import (
@@ -18,7 +17,9 @@ try:
         api_post,
         api_put,
         configure_page,
+        gather,
         get_selected_movie_id,
+        load_image_with_orientation,
         render_icon_heading,
         render_timeout_controls,
         set_selected_movie_id,
@@ -36,7 +37,9 @@ except ModuleNotFoundError:  # pragma: no cover
         api_post,
         api_put,
         configure_page,
+        gather,
         get_selected_movie_id,
+        load_image_with_orientation,
         render_icon_heading,
         render_timeout_controls,
         set_selected_movie_id,
@@ -132,11 +135,6 @@ def _resolve_image_path(raw_path: Any) -> Path | None:
     return path.resolve()
 
 
-def _load_image_with_orientation(path: Path):
-    with Image.open(path) as image:
-        return ImageOps.exif_transpose(image).copy()
-
-
 def _render_cover(item: dict[str, Any]) -> None:
     image_text = _display_text(item.get("image_path"))
     if image_text.startswith(("http://", "https://")):
@@ -146,7 +144,7 @@ def _render_cover(item: dict[str, Any]) -> None:
     image_path = _resolve_image_path(image_text)
     if image_path and image_path.exists():
         try:
-            st.image(_load_image_with_orientation(image_path), width="stretch")
+            st.image(load_image_with_orientation(image_path), width="stretch")
         except (OSError, ValueError) as exc:
             st.warning(f"No se pudo cargar la carátula: {exc}")
             st.caption(f"Ruta guardada: `{image_text}`.")
@@ -227,10 +225,13 @@ def _select_item_id(rows: list[dict[str, Any]]) -> str:
     return selected_id
 
 
-try:
-    options_payload = api_get("/items/options", timeout=LONG_TIMEOUT_SECONDS)
-except Exception as exc:
-    st.error(f"No se pudieron cargar las opciones comerciales: {exc}")
+options_payload, rows = gather(
+    lambda: api_get("/items/options", timeout=LONG_TIMEOUT_SECONDS),
+    lambda: api_get("/items", timeout=LONG_TIMEOUT_SECONDS),
+    return_exceptions=True,
+)
+if isinstance(options_payload, Exception):
+    st.error(f"No se pudieron cargar las opciones comerciales: {options_payload}")
     st.stop()
 
 allowed_values = (
@@ -242,10 +243,8 @@ sections_index = build_tc_sections_index(
     options_payload.get("tc_sections") if isinstance(options_payload, dict) else {}
 )
 
-try:
-    rows = api_get("/items", timeout=LONG_TIMEOUT_SECONDS)
-except Exception as exc:
-    st.error(f"No se pudo cargar el catálogo comercial: {exc}")
+if isinstance(rows, Exception):
+    st.error(f"No se pudo cargar el catálogo comercial: {rows}")
     st.stop()
 
 if not rows:
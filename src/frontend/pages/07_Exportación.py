@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Any
 
 import streamlit as st
@@ -72,6 +73,19 @@ def _rows_from_editor_value(value: Any) -> list[dict[str, Any]]:
     return []
 
 
+def _export_file_loader(filename: str) -> Callable[[], bytes]:
+    # Deferred download: the CSV stays on the backend until the user clicks,
+    # so it is neither held in session state nor resent on every rerun.
+    def _load() -> bytes:
+        return api_get_bytes(
+            "/export/movies/file",
+            params={"filename": filename},
+            timeout=LONG_TIMEOUT_SECONDS,
+        )
+
+    return _load
+
+
 def _validation_error_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return [
         {
@@ -86,8 +100,8 @@ def _validation_error_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
 @st.dialog("Exportación completada", width="medium", dismissible=False)
 def _export_result_dialog() -> None:
-    export_bytes = st.session_state.get("movies_export_bytes")
-    export_name = str(st.session_state.get("movies_export_filename") or "peliculas.csv")
+    stored_name = str(st.session_state.get("movies_export_filename") or "")
+    export_name = stored_name or "peliculas.csv"
     export_path = str(st.session_state.get("movies_export_path") or "")
     export_rows = int(st.session_state.get("movies_export_rows") or 0)
     export_ids = list(st.session_state.get("movies_export_ids") or [])
@@ -96,10 +110,11 @@ def _export_result_dialog() -> None:
     if export_path:
         st.caption(f"Archivo guardado en `{export_path}`.")
 
-    if isinstance(export_bytes, (bytes, bytearray)):
+    # Without a stored filename there is no backend file to fetch.
+    if stored_name:
         st.download_button(
             label="Guardar también en este PC",
-            data=bytes(export_bytes),
+            data=_export_file_loader(export_name),
             file_name=export_name,
             mime="text/csv",
             type="primary",
@@ -284,12 +299,6 @@ if export_requested:
                 timeout=LONG_TIMEOUT_SECONDS,
             )
             filename = str(result.get("filename") or "peliculas.csv")
-            file_bytes = api_get_bytes(
-                "/export/movies/file",
-                params={"filename": filename},
-                timeout=LONG_TIMEOUT_SECONDS,
-            )
-            st.session_state["movies_export_bytes"] = file_bytes
             st.session_state["movies_export_filename"] = filename
             st.session_state["movies_export_path"] = str(result.get("path") or "")
             st.session_state["movies_export_rows"] = int(result.get("rows") or 0)
@@ -361,16 +370,14 @@ if omdb_covers_requested:
                 with st.expander("Ver errores de imagen 2"):
                     st.dataframe(failed, width="stretch", hide_index=True)
 
-download_bytes = st.session_state.get("movies_export_bytes")
-if isinstance(download_bytes, (bytes, bytearray)):
+last_export_name = str(st.session_state.get("movies_export_filename") or "")
+if last_export_name:
     st.divider()
     render_icon_heading("Última exportación", icon="download", level=2)
     st.download_button(
         label="Guardar una copia en este PC",
-        data=bytes(download_bytes),
-        file_name=str(
-            st.session_state.get("movies_export_filename") or "peliculas.csv"
-        ),
+        data=_export_file_loader(last_export_name),
+        file_name=last_export_name,
         mime="text/csv",
         width="stretch",
     )
@@ -8,6 +8,8 @@ try:
         api_get,
         api_post,
         configure_page,
+        gather,
+        invalidate_caches,
         render_icon_heading,
         render_timeout_controls,
     )
@@ -17,6 +19,8 @@ except ModuleNotFoundError:  # pragma: no cover
         api_get,
         api_post,
         configure_page,
+        gather,
+        invalidate_caches,
         render_icon_heading,
         render_timeout_controls,
     )
@@ -61,8 +65,10 @@ def _snapshot_rows(snapshots: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
 
 try:
-    status = api_get("/snapshots/status", timeout=LONG_TIMEOUT_SECONDS)
-    snapshots_payload = api_get("/snapshots", timeout=LONG_TIMEOUT_SECONDS)
+    status, snapshots_payload = gather(
+        lambda: api_get("/snapshots/status", timeout=LONG_TIMEOUT_SECONDS),
+        lambda: api_get("/snapshots", timeout=LONG_TIMEOUT_SECONDS),
+    )
 except Exception as exc:
     st.error(f"No se pudo cargar el estado de datos: {exc}")
     st.stop()
@@ -163,6 +169,7 @@ with st.expander("Importar snapshot", expanded=bool(external_snapshot)):
             except Exception as exc:
                 st.error(f"No se pudo importar el snapshot: {exc}")
             else:
+                invalidate_caches()
                 imported_snapshot = result.get("snapshot") or {}
                 st.success(
                     f"Snapshot importado: `{imported_snapshot.get('snapshot_id')}`"
@@ -1,31 +1,64 @@
+import hashlib
 import html
+import json
 import os
+import re
+import threading
 import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import requests
 import streamlit as st
+from PIL import Image
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ModuleNotFoundError:  # pragma: no cover
+    # Environments installed before orjson became a dependency keep working.
+    def _json_dumps(payload: Any) -> bytes:
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
 
 try:
     from src.project_meta import get_app_meta
+    from src.workflow_stages import (
+        STAGE_INDEX,
+        WORKFLOW_STAGES,
+        infer_review_stage,
+        normalize_workflow_stage,
+    )
 except ModuleNotFoundError:  # pragma: no cover
     from project_meta import get_app_meta
+    from workflow_stages import (
+        STAGE_INDEX,
+        WORKFLOW_STAGES,
+        infer_review_stage,  # noqa: F401 - re-exported for the pages
+        normalize_workflow_stage,
+    )
 
 API_URL = os.getenv("API_URL", "http://127.0.0.1:8000")
+# Normalized once so paths can be appended without a double slash.
+_API_BASE_URL = API_URL.rstrip("/")
+# Enough for several browser sessions running batched fetches at once.
+API_POOL_MAXSIZE = 16
 APP_META = get_app_meta()
 PAGE_ICON = """
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 640 640">
 <path d="M64 128C64 92.7 92.7 64 128 64H512C547.3 64 576 92.7 576 128V384C576 419.3 547.3 448 512 448H397.3L350.6 541.4C345.2 552.3 334 559.1 321.9 559.1C309.8 559.1 298.6 552.3 293.2 541.4L246.7 448H128C92.7 448 64 419.3 64 384V128zM192 176C174.3 176 160 190.3 160 208V304C160 321.7 174.3 336 192 336H448C465.7 336 480 321.7 480 304V208C480 190.3 465.7 176 448 176H192z"/>
 </svg>
 """
-WORKFLOW_STAGES = ("extraction", "imdb", "title_es", "omdb", "translation")
-STAGE_ALIASES = {
-    "extract_title_team": "extraction",
-    "search_imdb": "imdb",
-    "fetch_imdb_title_es": "title_es",
-    "fetch_omdb": "omdb",
-    "translate_plot": "translation",
-}
 STAGE_UI_LABELS = {
     "extraction": "Extracción",
     "imdb": "IMDb",
@@ -46,6 +79,23 @@ NODE_UI_LABELS = {
 }
 GLOBAL_SELECTED_MOVIE_KEY = "global_selected_movie_id"
 GLOBAL_SELECTED_MOVIE_SEQ_KEY = "global_selected_movie_seq"
+MOVIES_LIST_LIMIT = 5000
+JOB_POLL_INTERVAL_SESSION_KEY = "job_poll_interval_ms"
+JOB_POLL_DEFAULT_MS = 3000
+JOB_POLL_MIN_MS = 1000
+JOB_POLL_MAX_MS = 15000
+JOB_POLL_MAX_BACKOFF_SECONDS = 120.0
+JOB_ACTIVE_STATUSES = ("queued", "running")
+MOVIE_SELECTOR_PAGE_SIZE = 50
+MOVIE_DETAIL_BLOCK_SIZE = 10
+MOVIE_BLOCK_CACHE_ENTRIES = 64
+MOVIE_MEMO_SESSION_KEY = "movie_memo"
+MOVIE_MEMO_TTL_SECONDS = 30
+GATHER_MAX_WORKERS = 4
+TABLE_MIN_ROWS = 10
+TABLE_MAX_ROWS = 1000
+TABLE_DEFAULT_ROWS = 100
+JOB_SUBMIT_TIMEOUT_SECONDS = 30.0
 
 
 def _as_float(raw: str | None, default: float) -> float:
@@ -65,9 +115,21 @@ TIMEOUT_MODE_OPTIONS = (
     TIMEOUT_MODE_UNITARY,
     TIMEOUT_MODE_DISABLED,
 )
+_TIMEOUT_MODE_SET = frozenset(TIMEOUT_MODE_OPTIONS)
+_TIMEOUT_LABEL_TO_MODE = {
+    "Normal (por tipo de llamada)": TIMEOUT_MODE_NORMAL,
+    "Unitario (un solo timeout)": TIMEOUT_MODE_UNITARY,
+    "Desactivado (sin timeout)": TIMEOUT_MODE_DISABLED,
+}
+_TIMEOUT_MODE_LABELS = tuple(_TIMEOUT_LABEL_TO_MODE)
+_TIMEOUT_MODE_INDEX = {
+    mode: index for index, mode in enumerate(_TIMEOUT_LABEL_TO_MODE.values())
+}
+_DEFAULT_TIMEOUT_SETTINGS = (TIMEOUT_MODE_NORMAL, DEFAULT_TIMEOUT_SECONDS)
 TIMEOUT_MODE_SESSION_KEY = "api_timeout_mode"
 TIMEOUT_UNITARY_SESSION_KEY = "api_timeout_unitary_seconds"
-THEME_APPLIED_KEY = "_ui_theme_applied"
+# Resolved (mode, unitary seconds), written once per rerun by the sidebar.
+TIMEOUT_SETTINGS_SESSION_KEY = "api_timeout_settings"
 
 THEME_CSS = """
 <style>
@@ -238,16 +300,17 @@ code {
 
 </style>
 """
+# Whitespace is only dropped where CSS ignores it (never before a ':', which
+# would turn a descendant pseudo-class selector into a compound one).
+_THEME_CSS_MIN = re.sub(
+    r"\s*([{};>])\s*|([:,])\s+", r"\1\2", re.sub(r"\s+", " ", THEME_CSS)
+).strip()
 
 
 def _apply_theme() -> None:
-    applied = _get_session_value(THEME_APPLIED_KEY, False)
-    if not applied:
-        st.markdown(THEME_CSS, unsafe_allow_html=True)
-        _set_session_value(THEME_APPLIED_KEY, True)
-    else:
-        # Keep styles present after reruns or page switches.
-        st.markdown(THEME_CSS, unsafe_allow_html=True)
+    # Streamlit drops elements a rerun does not emit again, so the style block
+    # has to be sent every run; the minified copy keeps that payload small.
+    st.markdown(_THEME_CSS_MIN, unsafe_allow_html=True)
 
 
 def configure_page() -> None:
@@ -264,6 +327,18 @@ def configure_page() -> None:
         st.sidebar.caption(f"Changelog: {APP_META.changelog_path.name}")
 
 
+_STREAMLIT_SWITCH_PAGE = getattr(st, "switch_page", None)
+if not callable(_STREAMLIT_SWITCH_PAGE):  # pragma: no cover
+    _STREAMLIT_SWITCH_PAGE = None
+
+
+def switch_page(target: str) -> None:
+    if _STREAMLIT_SWITCH_PAGE is not None:
+        _STREAMLIT_SWITCH_PAGE(target)
+    else:
+        st.info("Tu versión de Streamlit no soporta `switch_page`.")
+
+
 def render_icon_heading(
     text: str,
     *,
@@ -284,8 +359,44 @@ def render_icon_heading(
     )
 
 
-def _url(path: str) -> str:
-    return f"{API_URL}{path}"
+class _BackendSession(requests.Session):
+    # Callers pass backend paths ("/movies"); absolute URLs go through as-is.
+    def request(self, method, url, *args, **kwargs):
+        if url.startswith("/"):
+            url = _API_BASE_URL + url
+        return super().request(method, url, *args, **kwargs)
+
+
+# Cached as a shared resource so keep-alive connections to the backend are
+# reused across reruns and sessions; a replaced session closes its pool.
+@st.cache_resource(show_spinner=False, on_release=lambda session: session.close())
+def _session() -> requests.Session:
+    session = _BackendSession()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=API_POOL_MAXSIZE,
+        # Only idempotent methods are retried (urllib3 default), so batch
+        # POSTs are never replayed against the backend. Jitter keeps several
+        # sessions from retrying in lockstep. Retry-After is left to the job
+        # poller, which waits without blocking the script thread.
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            backoff_jitter=0.2,
+            status_forcelist=(429, 502, 503, 504),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        ),
+    )
+    # Mounted on the backend prefix only: every api_* call shares one keep-alive
+    # pool, and the retry policy never applies to unrelated hosts.
+    session.mount(f"{_API_BASE_URL}/", adapter)
+    session.headers["Accept-Encoding"] = "gzip"
+    return session
+
+
+# Raised by the api_* helpers when the backend does not answer in time.
+ApiTimeout = requests.exceptions.ReadTimeout
 
 
 def _get_session_value(key: str, default: Any) -> Any:
@@ -303,12 +414,14 @@ def _set_session_value(key: str, value: Any) -> None:
 
 
 def _normalize_timeout_mode(raw: Any) -> str:
+    # Stored modes are already canonical; only foreign values get cleaned up.
+    if raw in _TIMEOUT_MODE_SET:
+        return raw
     mode = str(raw or "").strip().lower()
-    return mode if mode in TIMEOUT_MODE_OPTIONS else TIMEOUT_MODE_DISABLED
+    return mode if mode in _TIMEOUT_MODE_SET else TIMEOUT_MODE_DISABLED
 
 
-def _unitary_timeout_seconds() -> float:
-    raw = _get_session_value(TIMEOUT_UNITARY_SESSION_KEY, DEFAULT_TIMEOUT_SECONDS)
+def _unitary_timeout_seconds(raw: Any) -> float:
     try:
         value = float(raw)
     except (TypeError, ValueError):
@@ -316,35 +429,57 @@ def _unitary_timeout_seconds() -> float:
     return value if value > 0 else DEFAULT_TIMEOUT_SECONDS
 
 
+def _timeout_settings() -> tuple[str, float]:
+    settings = _get_session_value(TIMEOUT_SETTINGS_SESSION_KEY, None)
+    if settings is not None:
+        return settings
+    raw_mode = _get_session_value(TIMEOUT_MODE_SESSION_KEY, None)
+    if raw_mode is None:
+        # Nothing chosen yet: normal mode, where the unitary value is unused.
+        return _DEFAULT_TIMEOUT_SETTINGS
+    mode = _normalize_timeout_mode(raw_mode)
+    return mode, _unitary_timeout_seconds(
+        _get_session_value(TIMEOUT_UNITARY_SESSION_KEY, DEFAULT_TIMEOUT_SECONDS)
+    )
+
+
 def _effective_timeout(timeout: float | None) -> float | None:
     base_timeout = DEFAULT_TIMEOUT_SECONDS if timeout is None else timeout
-    mode = _normalize_timeout_mode(
-        _get_session_value(TIMEOUT_MODE_SESSION_KEY, TIMEOUT_MODE_NORMAL)
-    )
+    mode, unitary_seconds = _timeout_settings()
     if mode == TIMEOUT_MODE_DISABLED:
         return None
     if mode == TIMEOUT_MODE_UNITARY:
-        return _unitary_timeout_seconds()
+        return unitary_seconds
     return base_timeout
 
 
+def _job_poll_interval_ms() -> int:
+    try:
+        raw = int(
+            _get_session_value(JOB_POLL_INTERVAL_SESSION_KEY, JOB_POLL_DEFAULT_MS)
+        )
+    except (TypeError, ValueError):
+        raw = JOB_POLL_DEFAULT_MS
+    return min(max(raw, JOB_POLL_MIN_MS), JOB_POLL_MAX_MS)
+
+
 def render_timeout_controls() -> None:
+    state = st.session_state
     current_mode = _normalize_timeout_mode(
-        _get_session_value(TIMEOUT_MODE_SESSION_KEY, TIMEOUT_MODE_DISABLED)
+        state.get(TIMEOUT_MODE_SESSION_KEY, TIMEOUT_MODE_DISABLED)
+    )
+    current_unitary = _unitary_timeout_seconds(
+        state.get(TIMEOUT_UNITARY_SESSION_KEY, DEFAULT_TIMEOUT_SECONDS)
     )
-    current_unitary = _unitary_timeout_seconds()
 
     with st.sidebar.expander("HTTP timeout", expanded=False):
-        label_to_mode = {
-            "Normal (por tipo de llamada)": TIMEOUT_MODE_NORMAL,
-            "Unitario (un solo timeout)": TIMEOUT_MODE_UNITARY,
-            "Desactivado (sin timeout)": TIMEOUT_MODE_DISABLED,
-        }
-        labels = list(label_to_mode.keys())
-        selected_label = labels[list(label_to_mode.values()).index(current_mode)]
-        mode_label = st.selectbox("Modo", labels, index=labels.index(selected_label))
-        mode = label_to_mode[mode_label]
-        _set_session_value(TIMEOUT_MODE_SESSION_KEY, mode)
+        mode_label = st.selectbox(
+            "Modo",
+            _TIMEOUT_MODE_LABELS,
+            index=_TIMEOUT_MODE_INDEX[current_mode],
+        )
+        mode = _TIMEOUT_LABEL_TO_MODE[mode_label]
+        state[TIMEOUT_MODE_SESSION_KEY] = mode
 
         unitary_value = st.number_input(
             "Timeout unitario (segundos)",
@@ -354,7 +489,9 @@ def render_timeout_controls() -> None:
             step=1.0,
             disabled=(mode != TIMEOUT_MODE_UNITARY),
         )
-        _set_session_value(TIMEOUT_UNITARY_SESSION_KEY, float(unitary_value))
+        # number_input enforces min_value, so the value needs no re-validation.
+        state[TIMEOUT_UNITARY_SESSION_KEY] = float(unitary_value)
+        state[TIMEOUT_SETTINGS_SESSION_KEY] = (mode, float(unitary_value))
 
         if mode == TIMEOUT_MODE_NORMAL:
             st.caption(
@@ -368,6 +505,19 @@ def render_timeout_controls() -> None:
         else:
             st.caption("Timeout desactivado: requests espera indefinidamente.")
 
+    with st.sidebar.expander("Sondeo de trabajos", expanded=False):
+        poll_ms = st.slider(
+            "Intervalo de sondeo (ms)",
+            min_value=JOB_POLL_MIN_MS,
+            max_value=JOB_POLL_MAX_MS,
+            value=_job_poll_interval_ms(),
+            step=500,
+        )
+        _set_session_value(JOB_POLL_INTERVAL_SESSION_KEY, int(poll_ms))
+        st.caption(
+            "Tras errores o HTTP 429 el intervalo se duplica hasta recuperar respuesta."
+        )
+
     with st.sidebar.expander("Debug UI state", expanded=False):
         if st.button("Restablecer estado de UI", width="stretch"):
             try:
@@ -410,31 +560,8 @@ def set_selected_movie_id(movie_id: str | None) -> None:
     _set_session_value(GLOBAL_SELECTED_MOVIE_SEQ_KEY, _get_selected_movie_seq() + 1)
 
 
-def normalize_workflow_stage(value: str | None) -> str | None:
-    if not value:
-        return None
-
-    text = value.strip().lower()
-    if not text:
-        return None
-
-    normalized = STAGE_ALIASES.get(text, text)
-    if normalized in WORKFLOW_STAGES:
-        return normalized
-
-    if ":" in text:
-        prefix = text.split(":", 1)[0].strip()
-        prefixed = STAGE_ALIASES.get(prefix, prefix)
-        if prefixed in WORKFLOW_STAGES:
-            return prefixed
-
-    for stage in WORKFLOW_STAGES:
-        if stage in text:
-            return stage
-
-    return None
-
-
+# Pure and called per row when labelling lists; stage values are few.
+@lru_cache(maxsize=128)
 def stage_ui_label(value: str | None) -> str:
     raw = str(value or "").strip()
     if not raw:
@@ -462,41 +589,69 @@ def node_ui_label(value: str | None) -> str:
     return NODE_UI_LABELS.get(raw, raw)
 
 
-def infer_review_stage(movie: dict[str, Any]) -> str | None:
-    for raw in (
-        movie.get("workflow_current_node"),
-        movie.get("workflow_review_reason"),
-    ):
-        stage = normalize_workflow_stage(str(raw) if raw is not None else None)
-        if stage:
-            return stage
-    return None
-
-
-def build_review_rerun_options(review_stage: str) -> list[tuple[str, str]]:
-    idx = WORKFLOW_STAGES.index(review_stage)
+@lru_cache(maxsize=16)
+def build_review_rerun_options(review_stage: str) -> tuple[tuple[str, str], ...]:
+    # Returned as a tuple so the shared cached value cannot be mutated.
+    idx = STAGE_INDEX[review_stage]
     target_label = stage_ui_label(review_stage)
-    options: list[tuple[str, str]] = [(f"Reejecutar fase {target_label}", review_stage)]
-    for start_stage in reversed(WORKFLOW_STAGES[:idx]):
-        start_label = stage_ui_label(start_stage)
-        options.append(
-            (f"Ejecutar desde {start_label} hasta {target_label}", start_stage)
+    return ((f"Reejecutar fase {target_label}", review_stage),) + tuple(
+        (
+            f"Ejecutar desde {stage_ui_label(start_stage)} hasta {target_label}",
+            start_stage,
         )
-    return options
+        for start_stage in reversed(WORKFLOW_STAGES[:idx])
+    )
 
 
 def movie_selector_label(movie: dict[str, Any]) -> str:
     movie_id = str(movie.get("id") or "").strip() or "?"
-    title = (
-        str(movie.get("manual_title") or "").strip()
-        or str(movie.get("extraction_title") or "").strip()
-        or "(sin título)"
-    )
+    for field in ("manual_title", "extraction_title"):
+        title = str(movie.get(field) or "").strip()
+        if title:
+            break
+    else:
+        title = "(sin título)"
     stage = stage_ui_label(str(movie.get("pipeline_stage") or "unknown"))
-    review = " | revisión" if bool(movie.get("workflow_needs_review")) else ""
+    # A BOOLEAN column: the backend only ever sends true, false or null.
+    review = " | revisión" if movie.get("workflow_needs_review") is True else ""
     return f"{movie_id} | {title} | {stage}{review}"
 
 
+def _movie_selector_options(
+    row_by_id: dict[str, dict[str, Any]],
+    movie_ids: list[str],
+    *,
+    selected: str,
+    search: str,
+) -> list[str]:
+    # Only a page of ids goes to the browser; the selected id is always
+    # kept so the widget value stays valid.
+    query = search.strip().lower()
+    if query:
+        matches: list[str] = []
+        for movie_id, row in row_by_id.items():
+            title = str(row.get("manual_title") or row.get("extraction_title") or "")
+            if query in movie_id.lower() or query in title.lower():
+                matches.append(movie_id)
+                if len(matches) >= MOVIE_SELECTOR_PAGE_SIZE:
+                    break
+        if selected not in matches:
+            matches.insert(0, selected)
+        return matches
+
+    if len(movie_ids) <= MOVIE_SELECTOR_PAGE_SIZE:
+        return movie_ids
+    try:
+        index = movie_ids.index(selected)
+    except ValueError:
+        index = 0
+    start = min(
+        max(0, index - MOVIE_SELECTOR_PAGE_SIZE // 2),
+        len(movie_ids) - MOVIE_SELECTOR_PAGE_SIZE,
+    )
+    return movie_ids[start : start + MOVIE_SELECTOR_PAGE_SIZE]
+
+
 def select_movie_id(
     rows: list[dict[str, Any]],
     *,
@@ -506,50 +661,66 @@ def select_movie_id(
     if not rows:
         raise ValueError("rows cannot be empty")
 
-    movie_ids = [str(row.get("id") or "").strip() for row in rows]
-    movie_ids = [movie_id for movie_id in movie_ids if movie_id]
-    if not movie_ids:
+    # One pass builds the id -> row map that every lookup below reuses.
+    row_by_id: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        movie_id = str(row.get("id") or "").strip()
+        if movie_id and movie_id not in row_by_id:
+            row_by_id[movie_id] = row
+    if not row_by_id:
         raise ValueError("rows do not contain valid movie ids")
+    movie_ids = list(row_by_id)
 
-    labels = {
-        str(row.get("id") or "").strip(): movie_selector_label(row)
-        for row in rows
-        if str(row.get("id") or "").strip()
-    }
-
+    # The widget keys go through a local handle; the global selection keeps
+    # using its helpers so their coercion lives in one place.
+    state = st.session_state
     preferred_global = get_selected_movie_id()
-    current_widget_value = _get_session_value(key, None)
+    current_widget_value = state.get(key)
     seen_seq_key = f"{key}__seen_global_seq"
-    seen_seq_raw = _get_session_value(seen_seq_key, -1)
     try:
-        seen_seq = int(seen_seq_raw)
+        seen_seq = int(state.get(seen_seq_key, -1))
     except (TypeError, ValueError):
         seen_seq = -1
-
     global_seq = _get_selected_movie_seq()
-    global_changed = seen_seq != global_seq
-    if global_changed:
-        if preferred_global in movie_ids:
-            _set_session_value(key, preferred_global)
-        elif current_widget_value in movie_ids:
-            _set_session_value(key, current_widget_value)
-        else:
-            _set_session_value(key, movie_ids[0])
-        _set_session_value(seen_seq_key, global_seq)
-    elif current_widget_value not in movie_ids:
-        if preferred_global in movie_ids:
-            _set_session_value(key, preferred_global)
+
+    if seen_seq != global_seq:
+        if preferred_global in row_by_id:
+            state[key] = preferred_global
+        elif current_widget_value in row_by_id:
+            state[key] = current_widget_value
         else:
-            _set_session_value(key, movie_ids[0])
+            state[key] = movie_ids[0]
+        state[seen_seq_key] = global_seq
+    elif current_widget_value not in row_by_id:
+        state[key] = preferred_global if preferred_global in row_by_id else movie_ids[0]
+
+    options = _movie_selector_options(
+        row_by_id,
+        movie_ids,
+        selected=str(state[key]),
+        search=st.text_input(
+            "Buscar película",
+            key=f"{key}__search",
+            placeholder="ID o título",
+        ),
+    )
+    labels = {
+        movie_id: movie_selector_label(row_by_id[movie_id]) for movie_id in options
+    }
+    if len(options) < len(movie_ids):
+        st.caption(
+            f"Mostrando {len(options)} de {len(movie_ids)} películas; "
+            "usa la búsqueda para acotar."
+        )
 
     selected = st.selectbox(
         label,
-        movie_ids,
+        options,
         key=key,
         format_func=lambda movie_id: labels.get(movie_id, movie_id),
     )
     set_selected_movie_id(selected)
-    _set_session_value(seen_seq_key, _get_selected_movie_seq())
+    state[seen_seq_key] = _get_selected_movie_seq()
     return selected
 
 
@@ -560,85 +731,231 @@ def render_movie_prev_next(
     key_prefix: str,
     noun: str = "Película",
 ) -> None:
-    movie_ids = [
-        str(row.get("id") or "").strip()
-        for row in rows
-        if str(row.get("id") or "").strip()
-    ]
-    if selected_id not in movie_ids:
+    movie_ids: list[str] = []
+    current_index = -1
+    for row in rows:
+        movie_id = str(row.get("id") or "").strip()
+        if not movie_id:
+            continue
+        if movie_id == selected_id and current_index < 0:
+            current_index = len(movie_ids)
+        movie_ids.append(movie_id)
+    if current_index < 0:
         return
 
-    current_index = movie_ids.index(selected_id)
+    last_index = len(movie_ids) - 1
+    # Callbacks update the selection before the rerun the click triggers, so
+    # no second st.rerun() pass is needed.
     nav_left, nav_center, nav_right = st.columns([1, 2, 1], gap="small")
     with nav_left:
-        if st.button(
+        st.button(
             "Anterior",
             disabled=current_index == 0,
             key=f"{key_prefix}_prev",
             width="stretch",
-        ):
-            set_selected_movie_id(movie_ids[current_index - 1])
-            st.rerun()
+            on_click=set_selected_movie_id,
+            args=(movie_ids[max(current_index - 1, 0)],),
+        )
     with nav_center:
         st.caption(f"{noun} {current_index + 1} de {len(movie_ids)} en este filtro.")
     with nav_right:
-        if st.button(
+        st.button(
             "Siguiente",
-            disabled=current_index >= len(movie_ids) - 1,
+            disabled=current_index >= last_index,
             key=f"{key_prefix}_next",
             width="stretch",
-        ):
-            set_selected_movie_id(movie_ids[current_index + 1])
-            st.rerun()
+            on_click=set_selected_movie_id,
+            args=(movie_ids[min(current_index + 1, last_index)],),
+        )
+
+
+def categorize_columns(df: Any, columns: tuple[str, ...]) -> Any:
+    # Repeated status strings are far cheaper to hold and serialize to Arrow
+    # as categoricals than as object columns.
+    present = [column for column in columns if column in df.columns]
+    if not present:
+        return df
+    return df.astype({column: "category" for column in present})
+
+
+def render_limited_dataframe(
+    df: Any,
+    *,
+    key: str,
+    default_rows: int = TABLE_DEFAULT_ROWS,
+    **kwargs: Any,
+) -> None:
+    total = len(df)
+    if total <= TABLE_MIN_ROWS:
+        st.dataframe(df, hide_index=True, **kwargs)
+        return
+
+    rows_col, all_col = st.columns([4, 1])
+    with all_col:
+        show_all = st.checkbox("Mostrar todas", key=f"{key}__all")
+    with rows_col:
+        max_rows = min(TABLE_MAX_ROWS, total)
+        limit = st.slider(
+            "Filas a mostrar",
+            min_value=TABLE_MIN_ROWS,
+            max_value=max_rows,
+            value=min(default_rows, max_rows),
+            key=f"{key}__rows",
+            disabled=show_all,
+        )
+    if show_all or limit >= total:
+        st.dataframe(df, hide_index=True, **kwargs)
+        return
+    st.caption(f"Mostrando {limit} de {total} filas")
+    st.dataframe(df.head(limit), hide_index=True, **kwargs)
+
+
+def _encode_json_body(kwargs: dict[str, Any]) -> dict[str, Any]:
+    if "json" not in kwargs:
+        return kwargs
+    payload = kwargs.pop("json")
+    if payload is None:
+        return kwargs
+    headers = dict(kwargs.pop("headers", None) or {})
+    headers.setdefault("Content-Type", "application/json")
+    return {**kwargs, "data": _json_dumps(payload), "headers": headers}
+
+
+def _decode(response: requests.Response) -> Any:
+    response.raise_for_status()
+    return _json_loads(response.content)
+
+
+class _InflightGet:
+    __slots__ = ("content", "done", "error", "status_code")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.content = b""
+        self.error: Exception | None = None
+        self.status_code: int | None = None
+
+    def waiter_error(self) -> Exception:
+        # Each waiter raises an exception of its own: re-raising the leader's
+        # object from several threads keeps growing its traceback, and would
+        # hand out the leader's response. Only the status is carried over.
+        error = self.error
+        if self.status_code is not None:
+            response = requests.Response()
+            response.status_code = self.status_code
+            return requests.exceptions.HTTPError(str(error), response=response)
+        try:
+            return type(error)(*error.args)
+        except TypeError:
+            return requests.exceptions.RequestException(str(error))
+
+
+# GETs on the wire, keyed by path and params: an identical concurrent call
+# waits for that response instead of sending its own. Only the bytes are
+# shared; each caller decodes its own copy.
+_INFLIGHT_GETS_LOCK = threading.Lock()
+_INFLIGHT_GETS: dict[tuple[str, str], _InflightGet] = {}
+
+
+def _single_flight_get(path: str, params: Any, timeout: float | None) -> bytes:
+    key = (path, repr(sorted(params.items()) if isinstance(params, dict) else params))
+    with _INFLIGHT_GETS_LOCK:
+        flight = _INFLIGHT_GETS.get(key)
+        leader = flight is None
+        if leader:
+            flight = _INFLIGHT_GETS[key] = _InflightGet()
+    if not leader:
+        # A waiter keeps its own timeout rather than the leader's.
+        if not flight.done.wait(timeout):
+            raise ApiTimeout(f"GET {path} did not finish within {timeout} s")
+        if flight.error is not None:
+            raise flight.waiter_error() from flight.error
+        return flight.content
+
+    try:
+        response = _session().request("GET", path, params=params, timeout=timeout)
+        response.raise_for_status()
+        flight.content = response.content
+        return flight.content
+    except Exception as exc:
+        if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+            flight.status_code = exc.response.status_code
+        flight.error = exc
+        raise
+    finally:
+        with _INFLIGHT_GETS_LOCK:
+            _INFLIGHT_GETS.pop(key, None)
+        flight.done.set()
 
 
 def api_get(path: str, *, timeout: float | None = None, **kwargs) -> Any:
     resolved_timeout = _effective_timeout(timeout)
-    response = requests.get(_url(path), timeout=resolved_timeout, **kwargs)
-    response.raise_for_status()
-    return response.json()
+    if kwargs.keys() - {"params"}:
+        response = _session().request("GET", path, timeout=resolved_timeout, **kwargs)
+        return _decode(response)
+    content = _single_flight_get(path, kwargs.get("params"), resolved_timeout)
+    return _json_loads(content)
 
 
 def api_get_bytes(path: str, *, timeout: float | None = None, **kwargs) -> bytes:
     resolved_timeout = _effective_timeout(timeout)
-    response = requests.get(_url(path), timeout=resolved_timeout, **kwargs)
+    response = _session().request("GET", path, timeout=resolved_timeout, **kwargs)
     response.raise_for_status()
     return response.content
 
 
 def api_post(path: str, *, timeout: float | None = None, **kwargs) -> Any:
     resolved_timeout = _effective_timeout(timeout)
-    response = requests.post(_url(path), timeout=resolved_timeout, **kwargs)
-    response.raise_for_status()
-    return response.json()
+    response = _session().request(
+        "POST", path, timeout=resolved_timeout, **_encode_json_body(kwargs)
+    )
+    return _decode(response)
 
 
 def api_put(path: str, *, timeout: float | None = None, **kwargs) -> Any:
     resolved_timeout = _effective_timeout(timeout)
-    response = requests.put(_url(path), timeout=resolved_timeout, **kwargs)
-    response.raise_for_status()
-    return response.json()
+    response = _session().request(
+        "PUT", path, timeout=resolved_timeout, **_encode_json_body(kwargs)
+    )
+    return _decode(response)
 
 
-def show_backend_status() -> None:
-    last_exc: Exception | None = None
-    max_attempts = 20
-    for attempt in range(max_attempts):
-        try:
-            api_get("/health", timeout=3.0)
-            st.success(f"Backend disponible: {API_URL}")
-            return
-        except Exception as exc:
-            last_exc = exc
-            if attempt < (max_attempts - 1):
-                time.sleep(0.5)
+def _api_get_once(path: str, *, timeout: float) -> Any:
+    # Bypasses the session adapter: a refused connection fails at once instead
+    # of going through the retry schedule, which is what a probe wants.
+    response = requests.get(_API_BASE_URL + path, timeout=timeout)
+    return _decode(response)
+
+
+# Stats and Ollama models share one round trip per TTL window.
+@st.cache_data(ttl=15, max_entries=1, show_spinner=False)
+def _bootstrap() -> dict[str, Any]:
+    return api_get("/frontend/bootstrap")
+
 
-    st.error(f"Backend no disponible: {API_URL} ({last_exc})")
+# One short probe; the verdict, failures included, is kept briefly so reruns
+# during an outage render the error at once instead of probing again.
+@st.cache_data(ttl=10, max_entries=1, show_spinner=False)
+def _probe_health() -> tuple[bool, str]:
+    try:
+        _api_get_once("/health", timeout=3.0)
+    except Exception as exc:
+        return False, str(exc)
+    return True, ""
+
+
+def show_backend_status() -> None:
+    ok, error = _probe_health()
+    if ok:
+        st.success(f"Backend disponible: {API_URL}")
+    else:
+        st.error(f"Backend no disponible: {API_URL} ({error})")
 
 
 def load_stats() -> dict[str, int]:
+    # Failures are not cached, so the zeroed fallback never outlives an outage.
     try:
-        return api_get("/stats")
+        return _bootstrap()["stats"]
     except Exception:
         return {
             "total": 0,
@@ -652,17 +969,322 @@ def load_stats() -> dict[str, int]:
         }
 
 
+def _thread_pool(workers: int) -> ThreadPoolExecutor:
+    # Worker threads need the script run context to read session state
+    # (timeout mode) through the api_* helpers.
+    ctx = get_script_run_ctx()
+    return ThreadPoolExecutor(
+        max_workers=max(1, workers),
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+    )
+
+
+def gather(*calls: Callable[[], Any], return_exceptions: bool = False) -> list[Any]:
+    # Runs independent backend calls concurrently; results keep call order.
+    with _thread_pool(min(len(calls), GATHER_MAX_WORKERS)) as pool:
+        futures = [pool.submit(call) for call in calls]
+    results: list[Any] = []
+    for future in futures:
+        exc = future.exception()
+        if exc is None:
+            results.append(future.result())
+        elif return_exceptions:
+            results.append(exc)
+        else:
+            raise exc
+    return results
+
+
+def _fetch_movies_batched(
+    total_hint: int,
+    *,
+    limit: int,
+    batch: int = 1000,
+    workers: int = 4,
+) -> list[dict[str, Any]]:
+    total = min(max(int(total_hint or 0), 0), limit)
+    if total <= batch:
+        return api_get("/movies", params={"limit": limit})
+
+    offsets = list(range(0, total, batch))
+    with _thread_pool(min(workers, len(offsets))) as pool:
+        futures = [
+            pool.submit(
+                api_get,
+                "/movies",
+                params={
+                    # The last batch covers up to `limit` so rows added after
+                    # the stats snapshot are not dropped.
+                    "limit": batch if offset + batch < total else limit - offset,
+                    "offset": offset,
+                },
+            )
+            for offset in offsets
+        ]
+        rows: list[dict[str, Any]] = []
+        for future in futures:
+            rows.extend(future.result())
+    return rows
+
+
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def load_movies(limit: int = MOVIES_LIST_LIMIT) -> list[dict[str, Any]]:
+    # /stats is only asked on a cache miss, to size the parallel batches.
+    total_hint = int(load_stats().get("total", 0))
+    return _fetch_movies_batched(total_hint, limit=limit)
+
+
+@st.cache_data(ttl=60, max_entries=8, show_spinner=False)
+def load_filtered_movies(
+    *,
+    has_imdb_id: bool = False,
+    has_plot_en: bool = False,
+    needs_review: bool = False,
+    review_stage: str | None = None,
+    limit: int = MOVIES_LIST_LIMIT,
+) -> list[dict[str, Any]]:
+    params: dict[str, Any] = {"limit": limit}
+    for name, enabled in (
+        ("has_imdb_id", has_imdb_id),
+        ("has_plot_en", has_plot_en),
+        ("needs_review", needs_review),
+    ):
+        if enabled:
+            params[name] = "true"
+    if review_stage:
+        params["review_stage"] = review_stage
+    return api_get("/movies", params=params)
+
+
+# Bounded: every block visited while browsing becomes a new key.
+@st.cache_data(ttl=30, max_entries=MOVIE_BLOCK_CACHE_ENTRIES, show_spinner=False)
+def _load_movie_block(movie_ids: tuple[str, ...]) -> dict[str, dict[str, Any]]:
+    movies = api_get("/movies/batch", params={"ids": list(movie_ids)})
+    return {movie["id"]: movie for movie in movies}
+
+
+def load_movie(
+    movie_id: str, rows: list[dict[str, Any]] | None = None
+) -> dict[str, Any]:
+    # A copy returned by a save in this session wins while it is fresh.
+    memo = _get_session_value(MOVIE_MEMO_SESSION_KEY, None) or {}
+    stamped = memo.get(movie_id)
+    if stamped is not None and time.monotonic() - stamped[0] < MOVIE_MEMO_TTL_SECONDS:
+        return stamped[1]
+
+    # Given the page's rows, the detail of the aligned block around the movie
+    # comes in one request, so prev/next inside the block hits the cache.
+    block: tuple[str, ...] = (movie_id,)
+    for index, row in enumerate(rows or ()):
+        if row.get("id") == movie_id:
+            start = index - index % MOVIE_DETAIL_BLOCK_SIZE
+            block = tuple(
+                str(item.get("id"))
+                for item in rows[start : start + MOVIE_DETAIL_BLOCK_SIZE]
+            )
+            break
+    movie = _load_movie_block(block).get(movie_id)
+    if movie is None:
+        # Gone since the list was loaded; the single GET raises the 404.
+        return api_get(f"/movies/{movie_id}")
+    return movie
+
+
+def invalidate_caches(updated_movie: dict[str, Any] | None = None) -> None:
+    # Call after any write that changes movies. Passing the movie a PUT
+    # returned keeps it at hand, so the next rerun needs no detail GET.
+    _bootstrap.clear()
+    load_movies.clear()
+    load_filtered_movies.clear()
+    _load_movie_block.clear()
+    memo: dict[str, tuple[float, dict[str, Any]]] = {}
+    if updated_movie and updated_movie.get("id"):
+        memo[str(updated_movie["id"])] = (time.monotonic(), updated_movie)
+    _set_session_value(MOVIE_MEMO_SESSION_KEY, memo)
+
+
+def fragment(func: Any = None, **kwargs: Any) -> Any:
+    # st.fragment needs Streamlit >= 1.37; older versions run the block as
+    # part of the full rerun.
+    if func is None:
+        return lambda inner: fragment(inner, **kwargs)
+    fragment_fn = getattr(st, "fragment", None)
+    if not callable(fragment_fn):
+        return func
+    return fragment_fn(func, **kwargs)
+
+
+_EXIF_ORIENTATION_TAG = 274
+_PREVIEW_MIN_SIDE = 1200
+_ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+
+def load_image_with_orientation(path: Path) -> Image.Image:
+    # Same rotation as ImageOps.exif_transpose, without rewriting the EXIF
+    # block and without the extra full-image copy it needs for display.
+    # draft() lets JPEG decode at a reduced scale that still covers the
+    # preview size; other formats ignore it.
+    with Image.open(path) as image:
+        image.draft(None, (_PREVIEW_MIN_SIDE, _PREVIEW_MIN_SIDE))
+        orientation = image.getexif().get(_EXIF_ORIENTATION_TAG)
+        method = _ORIENTATION_TRANSPOSE.get(orientation)
+        if method is None:
+            return image.copy()
+        return image.transpose(method)
+
+
+def lazy_expander(label: str, *, key: str, expanded: bool = False) -> Any:
+    # With on_change="rerun" the expander tracks its state, so callers can
+    # skip building closed content. Older Streamlit lacks the argument.
+    try:
+        return st.expander(label, expanded=expanded, key=key, on_change="rerun")
+    except TypeError:
+        return st.expander(label, expanded=expanded)
+
+
+def expander_is_open(container: Any) -> bool:
+    return getattr(container, "open", None) is not False
+
+
+def _job_result_key(state_key: str) -> str:
+    return f"{state_key}__result"
+
+
+def _job_token_key(state_key: str) -> str:
+    return f"{state_key}__token"
+
+
+def _job_backoff_key(state_key: str) -> str:
+    return f"{state_key}__backoff"
+
+
+def job_in_progress(state_key: str) -> bool:
+    return bool(st.session_state.get(state_key))
+
+
+def start_job(
+    path: str,
+    payload: dict[str, Any],
+    *,
+    state_key: str,
+    done_message: str,
+) -> str:
+    # The random part survives until the job finishes, so a second click that
+    # lands before the button is disabled resolves to the same backend job.
+    # The digest gives a different request (another movie, other options) its
+    # own key instead of reusing one the backend may already have accepted.
+    nonce = st.session_state.setdefault(_job_token_key(state_key), uuid.uuid4().hex)
+    request = json.dumps([path, payload], sort_keys=True, default=str)
+    token = f"{nonce}-{hashlib.sha256(request.encode('utf-8')).hexdigest()[:16]}"
+    job = api_post(
+        path,
+        json=payload,
+        headers={"Idempotency-Key": token},
+        timeout=JOB_SUBMIT_TIMEOUT_SECONDS,
+    )
+    job_id = str(job["job_id"])
+    st.session_state[state_key] = {"job_id": job_id, "done_message": done_message}
+    st.session_state.pop(_job_result_key(state_key), None)
+    st.session_state.pop(_job_backoff_key(state_key), None)
+    return job_id
+
+
+def render_job_status(state_key: str) -> None:
+    pending = st.session_state.get(state_key)
+    if pending:
+        # The fragment is built here so a new sidebar interval takes effect on
+        # the next full rerun; between reruns only the fragment ticks.
+        fragment(
+            _poll_job,
+            run_every=_job_poll_interval_ms() / 1000.0,
+            key=f"{state_key}__poll",
+        )(state_key, pending["job_id"])
+        return
+
+    finished = st.session_state.get(_job_result_key(state_key))
+    if not finished:
+        return
+    job = finished.get("job") or {}
+    if job.get("status") == "done":
+        st.success(finished.get("done_message") or "Trabajo completado")
+        st.json(job.get("result"))
+    else:
+        st.error(job.get("error") or "El trabajo terminó con error")
+
+
+def _back_off_job_poll(state_key: str, response: requests.Response | None) -> float:
+    previous = st.session_state.get(_job_backoff_key(state_key)) or {}
+    delay = float(previous.get("delay") or _job_poll_interval_ms() / 1000.0) * 2
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, float(retry_after))
+    delay = min(delay, JOB_POLL_MAX_BACKOFF_SECONDS)
+    st.session_state[_job_backoff_key(state_key)] = {
+        "delay": delay,
+        "retry_at": time.monotonic() + delay,
+    }
+    return delay
+
+
+def _poll_job(state_key: str, job_id: str) -> None:
+    backoff = st.session_state.get(_job_backoff_key(state_key))
+    if backoff and time.monotonic() < backoff["retry_at"]:
+        remaining = backoff["retry_at"] - time.monotonic()
+        st.info(f"Backend ocupado; nuevo intento de consulta en {remaining:.0f}s")
+        return
+
+    try:
+        job = api_get(f"/jobs/{job_id}", timeout=10.0)
+    except requests.exceptions.HTTPError as exc:
+        if exc.response is None or exc.response.status_code != 404:
+            delay = _back_off_job_poll(state_key, exc.response)
+            st.warning(
+                f"No se pudo consultar el trabajo ({exc}); reintento en {delay:.0f}s"
+            )
+            return
+        job = {"status": "error", "error": "El backend ya no conoce este trabajo"}
+    except Exception as exc:
+        delay = _back_off_job_poll(state_key, None)
+        st.warning(
+            f"No se pudo consultar el trabajo ({exc}); reintento en {delay:.0f}s"
+        )
+        return
+    st.session_state.pop(_job_backoff_key(state_key), None)
+
+    status = job.get("status")
+    if status in JOB_ACTIVE_STATUSES:
+        label = "en cola" if status == "queued" else "en curso"
+        st.info(f"Trabajo {label}... {float(job.get('elapsed_seconds') or 0):.0f}s")
+        return
+
+    pending = st.session_state.pop(state_key, None) or {}
+    st.session_state.pop(_job_token_key(state_key), None)
+    st.session_state[_job_result_key(state_key)] = {
+        "job": job,
+        "done_message": pending.get("done_message"),
+    }
+    invalidate_caches()
+    st.rerun()
+
+
 @st.cache_data(ttl=60)
 def load_cover_name_audit() -> dict[str, Any]:
     payload = api_get("/covers/name-audit")
     return payload if isinstance(payload, dict) else {}
 
 
-@st.cache_data(ttl=30)
-def load_ollama_models() -> list[str]:
-    payload = api_get("/models/ollama")
-    raw = payload.get("models", []) if isinstance(payload, dict) else []
-    return [str(item).strip() for item in raw if str(item).strip()]
+def load_ollama_models() -> tuple[str, ...]:
+    # Cached through _bootstrap, so invalidate_caches() refreshes it too. The
+    # backend already strips, drops empty names and dedupes.
+    return tuple(_bootstrap().get("ollama_models") or ())
 
 
 def select_ollama_model(
@@ -676,13 +1298,13 @@ def select_ollama_model(
     try:
         available = load_ollama_models()
     except Exception:
-        available = []
+        available = ()
 
-    options = available[:]
-    if resolved_default and resolved_default not in options:
-        options.insert(0, resolved_default)
-    if not options:
-        options = [resolved_default] if resolved_default else [""]
-
-    index = options.index(resolved_default) if resolved_default in options else 0
+    if resolved_default and resolved_default not in available:
+        options, index = (resolved_default, *available), 0
+    elif available:
+        options = available
+        index = available.index(resolved_default) if resolved_default else 0
+    else:
+        options, index = ("",), 0
     return st.selectbox(label, options, index=index, key=key)
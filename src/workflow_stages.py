@@ -0,0 +1,46 @@
+import re
+from typing import Any
+
+WORKFLOW_STAGES = ("extraction", "imdb", "title_es", "omdb", "translation")
+STAGE_INDEX = {stage: index for index, stage in enumerate(WORKFLOW_STAGES)}
+STAGE_ALIASES = {
+    "extract_title_team": "extraction",
+    "search_imdb": "imdb",
+    "fetch_imdb_title_es": "title_es",
+    "fetch_omdb": "omdb",
+    "translate_plot": "translation",
+}
+# Stage ids map to themselves, node names to their stage: one lookup each.
+_STAGE_LOOKUP = {**{stage: stage for stage in WORKFLOW_STAGES}, **STAGE_ALIASES}
+_STAGE_PATTERN = re.compile("|".join(map(re.escape, WORKFLOW_STAGES)))
+
+
+def normalize_workflow_stage(value: Any) -> str | None:
+    text = str(value or "").strip().lower()
+    if not text:
+        return None
+
+    normalized = _STAGE_LOOKUP.get(text)
+    if normalized:
+        return normalized
+
+    if ":" in text:
+        prefixed = _STAGE_LOOKUP.get(text.split(":", 1)[0].strip())
+        if prefixed:
+            return prefixed
+
+    # One C-level scan; the earliest pipeline stage wins, as it did when each
+    # stage was tested in order.
+    found = _STAGE_PATTERN.findall(text)
+    return min(found, key=STAGE_INDEX.__getitem__) if found else None
+
+
+def infer_review_stage(movie: dict[str, Any]) -> str | None:
+    for raw in (
+        movie.get("workflow_current_node"),
+        movie.get("workflow_review_reason"),
+    ):
+        stage = normalize_workflow_stage(raw)
+        if stage:
+            return stage
+    return None
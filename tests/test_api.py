@@ -3,6 +3,8 @@ import importlib
 import json
 import shutil
 import sys
+import threading
+import time
 from pathlib import Path
 
 import duckdb
@@ -94,6 +96,41 @@ def test_backend_imports_without_external_api_keys(tmp_path, monkeypatch):
     assert app.version == "0.2.0"
 
 
+def test_frontend_bootstrap_bundles_stats_and_models(tmp_path, monkeypatch):
+    app = _load_app(tmp_path, monkeypatch)
+    main = sys.modules["src.backend.main"]
+    client = TestClient(app)
+
+    monkeypatch.setattr(main, "list_ollama_models", lambda: ["llava:7b", "qwen2.5:7b"])
+    main._refresh_ollama_listing()
+    payload = client.get("/frontend/bootstrap").json()
+    assert payload == {
+        "stats": client.get("/stats").json(),
+        "ollama_models": ["llava:7b", "qwen2.5:7b"],
+    }
+
+    release = threading.Event()
+
+    def slow_failing_listing():
+        release.wait(5)
+        raise main.ClientError("Unable to list Ollama models")
+
+    # A stale listing is refreshed in the background; stats do not wait for it.
+    monkeypatch.setattr(main, "list_ollama_models", slow_failing_listing)
+    monkeypatch.setattr(main, "_ollama_listing", (0.0, ["llava:7b"]))
+    started = time.monotonic()
+    stale = client.get("/frontend/bootstrap").json()
+    assert time.monotonic() - started < 1
+    assert stale["ollama_models"] == ["llava:7b"]
+    assert stale["stats"]["total"] == 0
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while main._ollama_listing_refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.get("/frontend/bootstrap").json()["ollama_models"] == []
+
+
 def test_movies_schema_is_initialized_as_normalized_tables(tmp_path, monkeypatch):
     _load_app(tmp_path, monkeypatch)
     db_path = tmp_path / "movies.duckdb"
@@ -269,6 +306,226 @@ def test_startup_normalizes_existing_database_image_paths(tmp_path, monkeypatch)
     assert response.json()["image_path"] == "input/P0001.jpg"
 
 
+def test_list_movies_supports_offset_batches(tmp_path, monkeypatch):
+    app = _load_app(tmp_path, monkeypatch)
+    client = TestClient(app)
+    db_path = tmp_path / "movies.duckdb"
+
+    with duckdb.connect(str(db_path)) as con:
+        for movie_id in ("P0001", "P0002", "P0003"):
+            con.execute(
+                """
+                INSERT INTO movies_core (id, image_path, image_filename)
+                VALUES (?, ?, ?)
+                """,
+                [movie_id, f"input/{movie_id}.jpg", f"{movie_id}.jpg"],
+            )
+
+    first = client.get("/movies", params={"limit": 2, "offset": 0})
+    second = client.get("/movies", params={"limit": 2, "offset": 2})
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert [row["id"] for row in first.json()] == ["P0001", "P0002"]
+    assert [row["id"] for row in second.json()] == ["P0003"]
+    assert client.get("/movies", params={"offset": -1}).status_code == 400
+
+
+def test_list_movies_filters_flags_on_the_server(tmp_path, monkeypatch):
+    app = _load_app(tmp_path, monkeypatch)
+    client = TestClient(app)
+    db_path = tmp_path / "movies.duckdb"
+
+    with duckdb.connect(str(db_path)) as con:
+        for movie_id in ("P0001", "P0002", "P0003", "P0004"):
+            con.execute(
+                """
+                INSERT INTO movies_core (id, image_path, image_filename)
+                VALUES (?, ?, ?)
+                """,
+                [movie_id, f"input/{movie_id}.jpg", f"{movie_id}.jpg"],
+            )
+        con.executemany(
+            "INSERT INTO movie_imdb (id, imdb_id) VALUES (?, ?)",
+            [["P0001", "tt0000001"], ["P0002", "tt0000002"], ["P0003", "tt0000003"]],
+        )
+        con.executemany(
+            "INSERT INTO movie_omdb (id, omdb_plot_en) VALUES (?, ?)",
+            [["P0001", "Plot one"], ["P0003", "Plot three"]],
+        )
+        con.executemany(
+            """
+            INSERT INTO movie_workflow (id, workflow_needs_review, workflow_current_node)
+            VALUES (?, ?, ?)
+            """,
+            [
+                ["P0001", True, "fetch_omdb"],
+                ["P0002", True, "translate_plot"],
+                ["P0004", True, "search_imdb"],
+            ],
+        )
+
+    def ids(**params):
+        response = client.get("/movies", params=params)
+        assert response.status_code == 200
+        return [row["id"] for row in response.json()]
+
+    assert ids(has_imdb_id=True) == ["P0001", "P0002", "P0003"]
+    assert ids(has_plot_en=True) == ["P0001", "P0003"]
+    assert ids(needs_review=True) == ["P0001", "P0002", "P0004"]
+    assert ids(has_imdb_id=True, review_stage="omdb") == ["P0001"]
+    assert ids(review_stage="translation") == ["P0002"]
+    assert ids(needs_review=True, limit=1, offset=1) == ["P0002"]
+    assert client.get("/movies", params={"review_stage": "other"}).status_code == 400
+
+
+def test_movies_batch_returns_details_in_request_order(tmp_path, monkeypatch):
+    app = _load_app(tmp_path, monkeypatch)
+    client = TestClient(app)
+    db_path = tmp_path / "movies.duckdb"
+
+    with duckdb.connect(str(db_path)) as con:
+        for movie_id in ("P0001", "P0002", "P0003"):
+            con.execute(
+                """
+                INSERT INTO movies_core (id, image_path, image_filename)
+                VALUES (?, ?, ?)
+                """,
+                [movie_id, f"input/{movie_id}.jpg", f"{movie_id}.jpg"],
+            )
+
+    response = client.get("/movies/batch", params={"ids": ["P0003", "P9999", "P0001", "P0003"]})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [movie["id"] for movie in payload] == ["P0003", "P0001"]
+    assert payload[0] == client.get("/movies/P0003").json()
+    assert client.get("/movies/batch").json() == []
+
+    too_many = [f"P{index:04d}" for index in range(101)]
+    assert client.get("/movies/batch", params={"ids": too_many}).status_code == 400
+
+
+def test_movie_updates_return_the_updated_movie(tmp_path, monkeypatch):
+    app = _load_app(tmp_path, monkeypatch)
+    client = TestClient(app)
+    db_path = tmp_path / "movies.duckdb"
+
+    with duckdb.connect(str(db_path)) as con:
+        con.execute(
+            """
+            INSERT INTO movies_core (id, image_path, image_filename)
+            VALUES ('P0001', 'input/P0001.jpg', 'P0001.jpg')
+            """
+        )
+
+    response = client.put("/movies/P0001/plot-es", json={"plot_es": "Sinopsis manual"})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["ok"] is True
+    assert payload["movie"]["omdb_plot_es"] == "Sinopsis manual"
+    assert payload["movie"]["translation_status"] == "manual"
+    assert payload["movie"] == client.get("/movies/P0001").json()
+
+
+def test_large_responses_are_gzip_compressed(tmp_path, monkeypatch):
+    app = _load_app(tmp_path, monkeypatch)
+    client = TestClient(app)
+    db_path = tmp_path / "movies.duckdb"
+
+    with duckdb.connect(str(db_path)) as con:
+        for index in range(1, 11):
+            movie_id = f"P{index:04d}"
+            con.execute(
+                """
+                INSERT INTO movies_core (id, image_path, image_filename)
+                VALUES (?, ?, ?)
+                """,
+                [movie_id, f"input/{movie_id}.jpg", f"{movie_id}.jpg"],
+            )
+
+    response = client.get("/movies", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 10
+    assert "content-encoding" not in client.get("/health").headers
+
+
+def test_workflow_run_job_is_submitted_and_polled(tmp_path, monkeypatch):
+    app = _load_app(tmp_path, monkeypatch)
+    client = TestClient(app)
+    from src.backend.services import workflow as workflow_service
+
+    calls = []
+
+    def fake_run_batch(**kwargs):
+        calls.append(kwargs)
+        return {"processed": 1, "items": []}
+
+    monkeypatch.setattr(workflow_service, "run_batch", fake_run_batch)
+
+    response = client.post(
+        "/jobs/workflow/run",
+        json={"movie_id": "P0001", "limit": 1, "start_stage": "imdb", "stop_after": "imdb"},
+    )
+    assert response.status_code == 200
+    job_id = response.json()["job_id"]
+    assert response.json()["status"] in {"queued", "running", "done"}
+
+    deadline = time.monotonic() + 5
+    job = client.get(f"/jobs/{job_id}").json()
+    while job["status"] in {"queued", "running"} and time.monotonic() < deadline:
+        time.sleep(0.01)
+        job = client.get(f"/jobs/{job_id}").json()
+
+    assert job["status"] == "done"
+    assert job["result"] == {"processed": 1, "items": []}
+    assert job["kind"] == "workflow_run"
+    assert calls[0]["movie_id"] == "P0001"
+    assert calls[0]["title_model"] == "test-title-model"
+    assert calls[0]["max_attempts"] == 2
+    assert client.get("/jobs/unknown").status_code == 404
+
+
+def test_job_submission_is_idempotent_per_key(tmp_path, monkeypatch):
+    app = _load_app(tmp_path, monkeypatch)
+    client = TestClient(app)
+    from src.backend.services import workflow as workflow_service
+
+    calls = []
+
+    def fake_run_batch(**kwargs):
+        calls.append(kwargs)
+        return {"processed": 0, "items": []}
+
+    monkeypatch.setattr(workflow_service, "run_batch", fake_run_batch)
+
+    payload = {"limit": 5, "overwrite": False}
+    first = client.post("/jobs/imdb/search", json=payload, headers={"Idempotency-Key": "k1"})
+    again = client.post("/jobs/imdb/search", json=payload, headers={"Idempotency-Key": "k1"})
+    other = client.post("/jobs/imdb/search", json=payload, headers={"Idempotency-Key": "k2"})
+
+    reused = client.post(
+        "/jobs/imdb/search",
+        json={"limit": 1, "overwrite": False},
+        headers={"Idempotency-Key": "k1"},
+    )
+
+    assert first.status_code == 200
+    assert again.json()["job_id"] == first.json()["job_id"]
+    assert other.json()["job_id"] != first.json()["job_id"]
+    assert reused.status_code == 409
+
+    deadline = time.monotonic() + 5
+    while len(calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    assert len(calls) == 2
+    assert calls[0]["start_stage"] == "imdb"
+
+
 
 
 def test_imdb_search_keeps_trying_google_after_one_query_has_no_results(tmp_path, monkeypatch):
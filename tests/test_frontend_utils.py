@@ -0,0 +1,89 @@
+import threading
+
+import pytest
+import requests
+
+from src.frontend import utils
+
+
+class FakeSession:
+    def __init__(self, status_code: int = 200, content: bytes = b'{"ok": true}'):
+        self.status_code = status_code
+        self.content = content
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def request(self, method, path, **kwargs):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = f"http://backend{path}"
+        response._content = self.content
+        return response
+
+
+def _start_leader(session: FakeSession, outcome: dict) -> threading.Thread:
+    def run():
+        try:
+            outcome["content"] = utils._single_flight_get("/movies", None, 5.0)
+        except requests.exceptions.RequestException as exc:
+            outcome["error"] = exc
+
+    leader = threading.Thread(target=run)
+    leader.start()
+    assert session.started.wait(5)
+    return leader
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(utils, "_session", lambda: session)
+    return session
+
+
+def test_single_flight_get_shares_one_request(fake_session):
+    outcome: dict = {}
+    leader = _start_leader(fake_session, outcome)
+    threading.Timer(0.1, fake_session.release.set).start()
+
+    content = utils._single_flight_get("/movies", None, 5.0)
+    leader.join(5)
+
+    assert content == outcome["content"] == b'{"ok": true}'
+    assert fake_session.calls == 1
+    assert utils._INFLIGHT_GETS == {}
+
+
+def test_single_flight_get_gives_each_waiter_its_own_error(fake_session):
+    fake_session.status_code = 404
+    outcome: dict = {}
+    leader = _start_leader(fake_session, outcome)
+    threading.Timer(0.1, fake_session.release.set).start()
+
+    with pytest.raises(requests.exceptions.HTTPError) as raised:
+        utils._single_flight_get("/movies", None, 5.0)
+    leader.join(5)
+
+    leader_error = outcome["error"]
+    assert raised.value is not leader_error
+    assert raised.value.__cause__ is leader_error
+    assert raised.value.response.status_code == 404
+    assert raised.value.response is not leader_error.response
+    assert utils._INFLIGHT_GETS == {}
+
+
+def test_single_flight_waiter_times_out_on_its_own_timeout(fake_session):
+    outcome: dict = {}
+    leader = _start_leader(fake_session, outcome)
+
+    with pytest.raises(utils.ApiTimeout):
+        utils._single_flight_get("/movies", None, 0.05)
+
+    fake_session.release.set()
+    leader.join(5)
+    assert outcome["content"] == b'{"ok": true}'
+    assert utils._INFLIGHT_GETS == {}
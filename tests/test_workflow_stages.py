@@ -0,0 +1,18 @@
+from src.workflow_stages import infer_review_stage, normalize_workflow_stage
+
+
+def test_normalize_workflow_stage_accepts_ids_nodes_and_reasons():
+    assert normalize_workflow_stage("OMDb") == "omdb"
+    assert normalize_workflow_stage("fetch_imdb_title_es") == "title_es"
+    assert normalize_workflow_stage("translate_plot: timeout") == "translation"
+    assert normalize_workflow_stage("retry omdb after imdb failed") == "imdb"
+    assert normalize_workflow_stage("  ") is None
+    assert normalize_workflow_stage(None) is None
+
+
+def test_infer_review_stage_prefers_current_node_over_reason():
+    movie = {"workflow_current_node": "search_imdb", "workflow_review_reason": "omdb"}
+
+    assert infer_review_stage(movie) == "imdb"
+    assert infer_review_stage({"workflow_review_reason": "omdb: no match"}) == "omdb"
+    assert infer_review_stage({}) is None